@@ -0,0 +1,111 @@
+"""
+Nearest-neighbor route sequencing kernels for CourierOptimizer.
+
+The tour starts at the depot (row/column 0 of the distance matrix) and
+serves priority groups in ascending code order, always moving to the
+closest unvisited delivery of the current group.
+
+If the compiled extension (_courier_c) is built, its kernel is used.
+Otherwise the scalar kernel is JIT-compiled when Numba is installed, and
+as a last resort a NumPy implementation (one vectorized argmin per step)
+is used.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Numba is optional
+    numba = None
+
+try:
+    from ._courier_c import nn_tour as _nn_tour_c
+except ImportError:  # Compiled extension is optional
+    _nn_tour_c = None
+
+
+def _nn_tour_scalar(dist, codes):
+    """
+    Nearest-neighbor tour as plain loops (the Numba compilation target).
+
+    Args:
+        dist: (N+1, N+1) distance matrix, index 0 is the depot
+        codes: (N,) int8 priority codes for deliveries 1..N
+
+    Returns:
+        int64 array with the visiting order of delivery indices (0-based)
+    """
+    n = codes.shape[0]
+    tour = np.empty(n, dtype=np.int64)
+    if n == 0:
+        return tour
+    if n == 1:
+        tour[0] = 0
+        return tour
+
+    visited = np.zeros(n, dtype=np.bool_)
+    position = 0
+    for step in range(n):
+        # Lowest remaining priority code first, then the nearest stop;
+        # strict comparisons keep the lowest index on ties
+        best = -1
+        best_code = 127
+        best_distance = np.inf
+        row = dist[position]
+        for i in range(n):
+            if visited[i]:
+                continue
+            code = codes[i]
+            d = row[i + 1]
+            if code < best_code or (code == best_code and d < best_distance):
+                best = i
+                best_code = code
+                best_distance = d
+        visited[best] = True
+        tour[step] = best
+        position = best + 1
+
+    return tour
+
+
+def _nn_tour_numpy(dist, codes):
+    """
+    Nearest-neighbor tour using one masked argmin per step.
+
+    Same contract and result as _nn_tour_scalar.
+    """
+    n = codes.shape[0]
+    tour = np.empty(n, dtype=np.int64)
+    if n < 2:
+        tour[:] = 0
+        return tour
+
+    # Stable sort on 1-byte priority codes; equal codes form contiguous groups
+    by_priority = np.argsort(codes, kind='stable')
+    _, group_starts = np.unique(codes[by_priority], return_index=True)
+    group_ends = np.append(group_starts[1:], n)
+
+    step = 0
+    position = 0
+    for start, end in zip(group_starts, group_ends):
+        members = by_priority[start:end] + 1
+        remaining = np.ones(len(members), dtype=bool)
+        for _ in range(len(members)):
+            row = np.where(remaining, dist[position, members], np.inf)
+            nearest = int(np.argmin(row))
+            remaining[nearest] = False
+            position = int(members[nearest])
+            tour[step] = position - 1
+            step += 1
+
+    return tour
+
+
+HAS_NUMBA = numba is not None
+
+if _nn_tour_c is not None:
+    nn_tour = _nn_tour_c
+elif HAS_NUMBA:
+    nn_tour = numba.njit(cache=True, boundscheck=False)(_nn_tour_scalar)
+else:
+    nn_tour = _nn_tour_numpy
@@ -1,7 +1,195 @@
-from typing import Dict, List, Any
+import importlib.util
+import itertools
+import math
+import os
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple, Union
+import numpy as np
 import pandas as pd
-from geopy.distance import geodesic
 from .logger import get_logger, timer
+from ._nn import nn_tour
+from .types import Delivery, DeliveryBatch
+
+try:
+    from . import _courier_c
+except ImportError:  # Compiled kernels are optional (python setup.py build_ext --inplace)
+    _courier_c = None
+
+# Deliveries may be passed as a list of records (Delivery or dict) or as a
+# column-oriented batch
+Deliveries = Union[List[Delivery], List[Dict], DeliveryBatch]
+
+
+# Allowed values, hoisted so membership checks are O(1) hash lookups
+_PRIORITIES = frozenset({'HIGH', 'MEDIUM', 'LOW'})
+_TRANSPORT_MODES = frozenset({'CAR', 'BICYCLE', 'WALKING'})
+_OPTIMIZATION_CRITERIA = frozenset({'FASTEST', 'CHEAPEST', 'GREENEST'})
+
+# Validation violation bits; a delivery is valid when no bit is set
+WEIGHT_OVER_MAX = 1
+WEIGHT_NEGATIVE = 2
+PRIORITY_INVALID = 4
+LATITUDE_OUT_OF_BOUNDS = 8
+LONGITUDE_OUT_OF_BOUNDS = 16
+CUSTOMER_EMPTY = 32
+
+# Warning message per violation bit, in reporting order
+_WARNING_TEMPLATES = (
+    (WEIGHT_OVER_MAX, "Weight {weight}kg exceeds maximum {max_weight}kg"),
+    (WEIGHT_NEGATIVE, "Weight cannot be negative: {weight}kg"),
+    (PRIORITY_INVALID, "Invalid priority '{priority}'. Must be: {priority_options}"),
+    (LATITUDE_OUT_OF_BOUNDS, "Latitude {latitude} outside Oslo bounds ({lat_min}-{lat_max})"),
+    (LONGITUDE_OUT_OF_BOUNDS, "Longitude {longitude} outside Oslo bounds ({lon_min}-{lon_max})"),
+    (CUSTOMER_EMPTY, "Customer name cannot be empty"),
+)
+_PRIORITY_OPTIONS = ', '.join(_PRIORITIES)
+
+# Per-mode constants, frozen at import time (speed in km/h, cost in NOK/km, CO2 in g/km)
+_SPEED_KMH = {'CAR': 50, 'BICYCLE': 15, 'WALKING': 5}
+_COST_NOK_PER_KM = {'CAR': 4.0, 'BICYCLE': 0.0, 'WALKING': 0.0}
+_CO2_G_PER_KM = {'CAR': 120, 'BICYCLE': 0, 'WALKING': 0}
+
+# Below this many stops, per-leg work uses scalar math instead of NumPy arrays
+# (array setup costs more than it saves on short routes)
+_VECTORIZE_THRESHOLD = 24
+
+# Priority sort codes (lower is served first); unknown priorities sort as LOW
+_PRIORITY_CODES = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
+
+
+# Optional fast CSV ingest: set COURIER_FAST_IO=1 to parse with PyArrow's
+# multithreaded reader when pyarrow is installed (pandas stays the default)
+FAST_IO_ENV_VAR = 'COURIER_FAST_IO'
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def _csv_engine() -> Optional[str]:
+    """Return the pandas CSV engine to use ('pyarrow' when fast IO is enabled)."""
+    if _HAS_PYARROW and os.environ.get(FAST_IO_ENV_VAR) == '1':
+        return 'pyarrow'
+    return None
+
+
+# Degrees to radians; same factor math.radians uses, without the call
+_DEG2RAD = math.pi / 180.0
+
+# Box around Oslo where distances use the equirectangular approximation
+# (legs are at most a few tens of km, so it stays within 0.05% of Haversine)
+_FAST_PATH_LAT_MIN, _FAST_PATH_LAT_MAX = 59.7, 60.1
+_FAST_PATH_LON_MIN, _FAST_PATH_LON_MAX = 10.5, 11.0
+
+
+@lru_cache(maxsize=4096)
+def _point_trig(lat: float, lon: float):
+    """
+    Per-point Haversine terms, cached because the depot and recent stops repeat.
+    
+    Returns:
+        Tuple of (latitude in radians, cos(latitude), longitude in radians)
+    """
+    lat_rad = lat * _DEG2RAD
+    return lat_rad, math.cos(lat_rad), lon * _DEG2RAD
+
+
+class ValidationWarnings(Sequence):
+    """
+    Read-only list of warning messages for one delivery, built on first access.
+    
+    Validation only records a violation bitmask and the offending values;
+    message strings are formatted when the warnings are actually read, so
+    valid deliveries never allocate any. Compares equal to a plain list.
+    """
+    
+    __slots__ = ('flags', '_values', '_messages')
+    
+    def __init__(self, flags: int, weight: Any = None, priority: Any = None,
+                 latitude: Any = None, longitude: Any = None):
+        self.flags = int(flags)
+        self._values = (weight, priority, latitude, longitude)
+        self._messages = None if self.flags else []
+    
+    def _materialize(self) -> List[str]:
+        if self._messages is None:
+            weight, priority, latitude, longitude = self._values
+            fields = {
+                'weight': weight,
+                'priority': priority,
+                'latitude': latitude,
+                'longitude': longitude,
+                'max_weight': CourierOptimizer.MAX_WEIGHT_KG,
+                'priority_options': _PRIORITY_OPTIONS,
+                'lat_min': CourierOptimizer.OSLO_LAT_MIN,
+                'lat_max': CourierOptimizer.OSLO_LAT_MAX,
+                'lon_min': CourierOptimizer.OSLO_LON_MIN,
+                'lon_max': CourierOptimizer.OSLO_LON_MAX,
+            }
+            self._messages = [template.format(**fields)
+                              for bit, template in _WARNING_TEMPLATES
+                              if self.flags & bit]
+        return self._messages
+    
+    def __getitem__(self, index):
+        return self._materialize()[index]
+    
+    def __len__(self) -> int:
+        # One message per set bit, no formatting needed
+        return bin(self.flags).count('1')
+    
+    def __iter__(self):
+        return iter(self._materialize())
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, ValidationWarnings)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
+def _coordinate_columns(deliveries: Deliveries) -> Tuple[np.ndarray, np.ndarray]:
+    """Get (latitudes, longitudes) as float64 arrays for either delivery container."""
+    if isinstance(deliveries, DeliveryBatch):
+        return (np.asarray(deliveries['latitude'], dtype=np.float64),
+                np.asarray(deliveries['longitude'], dtype=np.float64))
+    n = len(deliveries)
+    return (np.fromiter((d['latitude'] for d in deliveries), dtype=np.float64, count=n),
+            np.fromiter((d['longitude'] for d in deliveries), dtype=np.float64, count=n))
+
+
+def _priority_codes(deliveries: Deliveries) -> np.ndarray:
+    """Map each delivery's priority to its int8 sort code."""
+    if isinstance(deliveries, DeliveryBatch):
+        if 'priority' not in deliveries.columns:
+            return np.full(len(deliveries), _PRIORITY_CODES['LOW'], dtype=np.int8)
+        codes = pd.Series(deliveries['priority']).astype(str).str.upper().map(_PRIORITY_CODES)
+        return codes.fillna(_PRIORITY_CODES['LOW']).to_numpy(dtype=np.int8)
+    return np.fromiter(
+        (_PRIORITY_CODES.get(str(d.get('priority', 'LOW')).upper(), 2) for d in deliveries),
+        dtype=np.int8, count=len(deliveries)
+    )
+
+
+def _mode_lookup(table: Dict[str, float], transport_mode: str) -> float:
+    """
+    Look up a per-mode constant, accepting any letter case.
+    
+    Canonical upper-case modes hit the table directly; other spellings are
+    upper-cased once before the second lookup.
+    
+    Raises:
+        ValueError: If the transport mode is unknown
+    """
+    try:
+        return table[transport_mode]
+    except KeyError:
+        pass
+    try:
+        return table[transport_mode.upper()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"Invalid transport mode: {transport_mode}") from None
 
 
 class CourierOptimizer:
@@ -16,30 +204,43 @@ class CourierOptimizer:
     OSLO_LON_MAX = 10.9  # Eastern boundary
     
     # Business rules from assignment requirements
-    VALID_PRIORITIES = {'HIGH', 'MEDIUM', 'LOW'}
-    VALID_TRANSPORT_MODES = {'CAR', 'BICYCLE', 'WALKING'}
-    VALID_OPTIMIZATION_CRITERIA = {'FASTEST', 'CHEAPEST', 'GREENEST'}
+    VALID_PRIORITIES = _PRIORITIES
+    VALID_TRANSPORT_MODES = _TRANSPORT_MODES
+    VALID_OPTIMIZATION_CRITERIA = _OPTIMIZATION_CRITERIA
     
     # Physical constraints
     MAX_WEIGHT_KG = 25.0  # Maximum package weight
     
+    # Mean Earth radius used by the Haversine distance formula
+    EARTH_RADIUS_KM = 6371.0
+    
+    # Depot location (Oslo City Hall) - all routes start and end here
+    DEPOT_LAT = 59.9114
+    DEPOT_LON = 10.7343
+    
+    # Above this many points the distance matrix is built in square tiles
+    # so each block of intermediates stays cache-sized
+    DISTANCE_MATRIX_TILE_THRESHOLD = 2000
+    DISTANCE_MATRIX_TILE = 1024
+    
+    # Output CSV layouts
+    ROUTE_CSV_COLUMNS = ['stop_number', 'customer', 'latitude', 'longitude',
+                         'priority', 'weight_kg', 'distance_km', 'cumulative_distance_km',
+                         'eta_hours', 'cost_nok', 'co2_grams']
+    REJECTED_CSV_COLUMNS = ['customer', 'latitude', 'longitude',
+                            'priority', 'weight_kg', 'warnings']
+    
+    # Rows materialized per write when streaming output CSVs
+    CSV_CHUNK_SIZE = 10_000
+    
     # Transport mode parameters (speed in km/h, cost in NOK/km, CO2 in g/km)
     TRANSPORT_PARAMS = {
-        'CAR': {
-            'speed_kmh': 50,
-            'cost_per_km': 4.0,
-            'co2_g_per_km': 120
-        },
-        'BICYCLE': {
-            'speed_kmh': 15,
-            'cost_per_km': 0.0,
-            'co2_g_per_km': 0
-        },
-        'WALKING': {
-            'speed_kmh': 5,
-            'cost_per_km': 0.0,
-            'co2_g_per_km': 0
+        mode: {
+            'speed_kmh': _SPEED_KMH[mode],
+            'cost_per_km': _COST_NOK_PER_KM[mode],
+            'co2_g_per_km': _CO2_G_PER_KM[mode]
         }
+        for mode in _SPEED_KMH
     }
     
     def __init__(self):
@@ -51,144 +252,237 @@ class CourierOptimizer:
         self.current_deliveries = []
         self.last_optimization_result = None
         
+        # Output directories already created by this instance
+        self._mkdir_cache: Set[Path] = set()
+        
         self.logger.info("CourierOptimizer instance created")
     
-    def _validate_weight(self, weight: float) -> List[str]:
+    def _violation_flags(self, weight: Any, priority: Any, latitude: Any,
+                         longitude: Any, customer: Any) -> int:
         """
-        Validate package weight against business rules.
+        Check one delivery's fields against the business rules.
+        
+        Returns:
+            Bitmask of violations (0 if valid)
         """
-        warnings = []
+        flags = 0
         
+        # Physical constraints
         if weight > self.MAX_WEIGHT_KG:
-            warnings.append(f"Weight {weight}kg exceeds maximum {self.MAX_WEIGHT_KG}kg")
-        
+            flags |= WEIGHT_OVER_MAX
         if weight < 0:
-            warnings.append(f"Weight cannot be negative: {weight}kg")
-            
-        return warnings
-    
-    def _validate_priority(self, priority: str) -> List[str]:
-        """
-        Validate priority level against allowed values.
+            flags |= WEIGHT_NEGATIVE
         
-        Args:
-            priority: Priority string (case-insensitive)
-            
-        Returns:
-            List of warning messages (empty if valid)
-        """
-        warnings = []
-        priority_upper = priority.upper() if priority else ''
+        # Priority is case-insensitive
+        if not isinstance(priority, str) or priority.upper() not in _PRIORITIES:
+            flags |= PRIORITY_INVALID
         
-        if priority_upper not in self.VALID_PRIORITIES:
-            valid_options = ', '.join(self.VALID_PRIORITIES)
-            warnings.append(f"Invalid priority '{priority}'. Must be: {valid_options}")
-            
-        return warnings
-    
-    def _validate_coordinates(self, latitude: float, longitude: float) -> List[str]:
+        # Coordinates must fall within Oslo's service area
+        if not (self.OSLO_LAT_MIN <= latitude <= self.OSLO_LAT_MAX):
+            flags |= LATITUDE_OUT_OF_BOUNDS
+        if not (self.OSLO_LON_MIN <= longitude <= self.OSLO_LON_MAX):
+            flags |= LONGITUDE_OUT_OF_BOUNDS
+        
+        if not isinstance(customer, str) or not customer.strip():
+            flags |= CUSTOMER_EMPTY
+        
+        return flags
+
+    def validate_delivery(self, delivery: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Validate coordinates are within Oslo service area.
+        Validate a single delivery entry against business requirements.
         
         Args:
-            latitude: Latitude coordinate
-            longitude: Longitude coordinate
+            delivery: Dict or Delivery with keys: customer, latitude, longitude,
+                priority, weight_kg
             
         Returns:
-            List of warning messages (empty if valid)
-            
-         Note: Check if coordinates fall within Oslo's boundaries.
-        If outside, the delivery can't be serviced.
+            Dict with 'is_valid' (bool), '_flags' (violation bitmask) and
+            'warnings' (ValidationWarnings, a lazily formatted list of str)
         """
-        warnings = []
+        weight = delivery.get('weight_kg', 0)
+        priority = delivery.get('priority', '')
+        latitude = delivery.get('latitude', 0)
+        longitude = delivery.get('longitude', 0)
         
-        # Check latitude bounds (North-South position)
-        if not (self.OSLO_LAT_MIN <= latitude <= self.OSLO_LAT_MAX):
-            warnings.append(
-                f"Latitude {latitude} outside Oslo bounds "
-                f"({self.OSLO_LAT_MIN}-{self.OSLO_LAT_MAX})"
-            )
+        flags = self._violation_flags(weight, priority, latitude, longitude,
+                                      delivery.get('customer', ''))
         
-        # Check longitude bounds (East-West position)  
-        if not (self.OSLO_LON_MIN <= longitude <= self.OSLO_LON_MAX):
-            warnings.append(
-                f"Longitude {longitude} outside Oslo bounds "
-                f"({self.OSLO_LON_MIN}-{self.OSLO_LON_MAX})"
-            )
-            
-        return warnings
+        return {
+            'is_valid': flags == 0,
+            '_flags': flags,
+            'warnings': ValidationWarnings(flags, weight, priority, latitude, longitude)
+        }
     
-    def _validate_customer_name(self, customer: str) -> List[str]:
+    def _validation_flags(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
-        Validate customer name is present and printable.
+        Evaluate every business rule column-wise over a DataFrame.
+        
+        Missing columns fall back to the same defaults validate_delivery uses.
+        Numeric columns are coerced (unparseable values become NaN and fail
+        the coordinate check, matching how the scalar rules treat them).
         
         Args:
-            customer: Customer name string
+            data: DataFrame with delivery data
             
         Returns:
-            List of warning messages (empty if valid)
-        """
-        warnings = []
+            Dict with coerced 'weight', 'latitude' and 'longitude' arrays and
+            an int array 'flags' holding each row's violation bitmask
+        """
+        def column(name, default):
+            if name in data.columns:
+                return data[name]
+            return pd.Series(default, index=data.index)
+        
+        weight = pd.to_numeric(column('weight_kg', 0), errors='coerce')
+        latitude = pd.to_numeric(column('latitude', 0), errors='coerce')
+        longitude = pd.to_numeric(column('longitude', 0), errors='coerce')
+        priority = column('priority', '')
+        customer = column('customer', '')
+        
+        # NaN weight compares False on both sides, exactly like the scalar rule
+        flags = np.zeros(len(data), dtype=np.int64)
+        flags[(weight > self.MAX_WEIGHT_KG).to_numpy()] |= WEIGHT_OVER_MAX
+        flags[(weight < 0).to_numpy()] |= WEIGHT_NEGATIVE
+        flags[~priority.astype(str).str.upper().isin(_PRIORITIES).to_numpy()] |= PRIORITY_INVALID
+        flags[~latitude.between(self.OSLO_LAT_MIN, self.OSLO_LAT_MAX).to_numpy()] |= LATITUDE_OUT_OF_BOUNDS
+        flags[~longitude.between(self.OSLO_LON_MIN, self.OSLO_LON_MAX).to_numpy()] |= LONGITUDE_OUT_OF_BOUNDS
+        # Only non-blank text is a customer name, as in the scalar rule
+        named = customer.map(lambda value: isinstance(value, str) and value.strip() != '')
+        flags[~named.to_numpy(dtype=bool)] |= CUSTOMER_EMPTY
         
-        if not customer or not customer.strip():
-            warnings.append("Customer name cannot be empty")
-        elif len(customer.strip()) < 1:
-            warnings.append("Customer name cannot be empty")
-            
-        return warnings
-
-    def validate_delivery(self, delivery: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'weight': weight.to_numpy(),
+            'latitude': latitude.to_numpy(),
+            'longitude': longitude.to_numpy(),
+            'flags': flags,
+        }
+    
+    def _validation_flags_arrow(self, table) -> Dict[str, Any]:
         """
-        Validate a single delivery entry against business requirements.
+        Evaluate every business rule over a pyarrow.Table with Arrow compute kernels.
+        
+        Same rules, defaults and return value as _validation_flags; the
+        table is never converted to a DataFrame.
         
         Args:
-            delivery: Dict with keys: customer, latitude, longitude, priority, weight_kg
+            table: pyarrow.Table with delivery data
             
         Returns:
-            Dict with 'is_valid' (bool) and 'warnings' (list of str)
-        """
-        all_warnings = []
+            Dict with coerced 'weight', 'latitude' and 'longitude' arrays and
+            an int array 'flags' holding each row's violation bitmask
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        n = table.num_rows
+        
+        def numeric(name, default):
+            if name not in table.column_names:
+                return pa.array(np.full(n, default, dtype=np.float64))
+            values = table[name]
+            if pa.types.is_integer(values.type) or pa.types.is_floating(values.type):
+                return values
+            # Text columns: unparseable values become null, like errors='coerce'
+            return pa.array(pd.to_numeric(values.to_pandas(), errors='coerce'))
+        
+        def text(name):
+            if name not in table.column_names:
+                return pa.array([''] * n, type=pa.string())
+            values = table[name]
+            if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+                return values
+            return pc.cast(values, pa.string())
+        
+        def between(values, low, high):
+            inside = pc.and_(pc.greater_equal(values, low), pc.less_equal(values, high))
+            return pc.fill_null(inside, False)
+        
+        weight = numeric('weight_kg', 0)
+        latitude = numeric('latitude', 0)
+        longitude = numeric('longitude', 0)
+        priority = text('priority')
+        customer = table['customer'] if 'customer' in table.column_names else text('customer')
+        if pa.types.is_string(customer.type) or pa.types.is_large_string(customer.type):
+            customer_empty = pc.equal(pc.utf8_trim_whitespace(pc.fill_null(customer, '')), '')
+        else:
+            # Non-text values are never a customer name, as in the scalar rule
+            customer_empty = pa.array(np.ones(n, dtype=bool))
+        
+        # Null comparisons count as "no violation" for weight, like NaN in pandas
+        rules = (
+            (WEIGHT_OVER_MAX, pc.fill_null(pc.greater(weight, self.MAX_WEIGHT_KG), False)),
+            (WEIGHT_NEGATIVE, pc.fill_null(pc.less(weight, 0), False)),
+            (PRIORITY_INVALID, pc.invert(pc.fill_null(
+                pc.is_in(pc.utf8_upper(priority), value_set=pa.array(sorted(_PRIORITIES))),
+                False))),
+            (LATITUDE_OUT_OF_BOUNDS, pc.invert(between(latitude, self.OSLO_LAT_MIN, self.OSLO_LAT_MAX))),
+            (LONGITUDE_OUT_OF_BOUNDS, pc.invert(between(longitude, self.OSLO_LON_MIN, self.OSLO_LON_MAX))),
+            (CUSTOMER_EMPTY, customer_empty),
+        )
         
-        # Use all validation helpers to collect warnings
-        all_warnings.extend(self._validate_weight(delivery.get('weight_kg', 0)))
-        all_warnings.extend(self._validate_priority(delivery.get('priority', '')))
-        all_warnings.extend(self._validate_coordinates(
-            delivery.get('latitude', 0), 
-            delivery.get('longitude', 0)
-        ))
-        all_warnings.extend(self._validate_customer_name(delivery.get('customer', '')))
+        flags = np.zeros(n, dtype=np.int64)
+        for bit, violated in rules:
+            flags[np.asarray(violated)] |= bit
         
         return {
-            'is_valid': len(all_warnings) == 0,
-            'warnings': all_warnings
+            'weight': np.asarray(weight),
+            'latitude': np.asarray(latitude),
+            'longitude': np.asarray(longitude),
+            'flags': flags,
         }
     
     @timer
-    def process_csv_data(self, data) -> Dict[str, List[Dict]]:
+    def process_csv_data(self, data) -> Dict[str, DeliveryBatch]:
         """
         Process CSV data and separate valid from invalid deliveries.
         
+        Rules are evaluated as whole-column bitmask operations; warnings are
+        only attached to rejected rows. Row order is preserved.
+        
         Args:
-            data: DataFrame with delivery data
+            data: DataFrame or pyarrow.Table with delivery data (a Table is
+                validated with Arrow compute kernels, without pandas)
             
         Returns:
-            Dict with 'valid_deliveries' and 'invalid_deliveries' lists
+            Dict with 'valid_deliveries' and 'invalid_deliveries' as
+            DeliveryBatch objects (column arrays; iterate or index by
+            position for per-delivery dicts, or call as_records())
         """
         self.logger.info(f"Processing {len(data)} deliveries")
         
-        valid_deliveries = []
-        invalid_deliveries = []
-        
-        for _, row in data.iterrows():
-            delivery = row.to_dict()
-            validation_result = self.validate_delivery(delivery)
-            
-            if validation_result['is_valid']:
-                valid_deliveries.append(delivery)
-            else:
-                # Add warnings to the delivery record for output
-                delivery['warnings'] = validation_result['warnings']
-                invalid_deliveries.append(delivery)
+        if hasattr(data, 'to_batches'):
+            checked = self._validation_flags_arrow(data)
+            records = DeliveryBatch.from_arrow(data)
+        else:
+            checked = self._validation_flags(data)
+            records = DeliveryBatch.from_frame(data)
+        flags = checked['flags']
+        valid_mask = flags == 0
+        
+        # Records carry the coerced numeric values so routing gets floats
+        for name in ('weight_kg', 'latitude', 'longitude'):
+            if name in records.columns:
+                records = records.with_column(name, checked['weight' if name == 'weight_kg' else name])
+        
+        rejected = np.flatnonzero(~valid_mask)
+        valid_deliveries = records.take(np.flatnonzero(valid_mask))
+        invalid_deliveries = records.take(rejected)
+        
+        # Add warnings to the rejected rows for output
+        priorities = (invalid_deliveries['priority'] if 'priority' in invalid_deliveries.columns
+                      else np.full(len(rejected), '', dtype=object))
+        warnings = np.empty(len(rejected), dtype=object)
+        for k, i in enumerate(rejected):
+            priority = priorities[k]
+            warnings[k] = ValidationWarnings(
+                flags[i],
+                checked['weight'][i],
+                priority if isinstance(priority, str) else '',
+                checked['latitude'][i],
+                checked['longitude'][i],
+            )
+        invalid_deliveries = invalid_deliveries.with_column('warnings', warnings)
         
         self.logger.info(f"Validation complete: {len(valid_deliveries)} valid, {len(invalid_deliveries)} invalid")
         
@@ -202,17 +496,21 @@ class CourierOptimizer:
     
     def is_valid_transport_mode(self, mode: str) -> bool:
         """Check if transport mode is valid."""
-        return mode.upper() in self.VALID_TRANSPORT_MODES
+        return mode in _TRANSPORT_MODES or mode.upper() in _TRANSPORT_MODES
     
     def is_valid_optimization_criteria(self, criteria: str) -> bool:
         """Check if optimization criteria is valid."""
-        return criteria.upper() in self.VALID_OPTIMIZATION_CRITERIA
+        return criteria in _OPTIMIZATION_CRITERIA or criteria.upper() in _OPTIMIZATION_CRITERIA
     
     def calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
         Calculate distance between two GPS coordinates.
         
-        Uses geopy's geodesic calculation for more accurate distance measurements
+        When both points lie in the Oslo box, uses the equirectangular
+        approximation (one cosine and a hypot); otherwise the Haversine
+        formula (great-circle distance on a sphere). Per-point radians/cosine
+        terms are cached, so repeated endpoints (e.g. the depot) skip those
+        transcendental calls.
         
         Args:
             lat1: Latitude of first point
@@ -223,9 +521,56 @@ class CourierOptimizer:
         Returns:
             Distance in kilometers
         """
-        point1 = (lat1, lon1)
-        point2 = (lat2, lon2)
-        return geodesic(point1, point2).kilometers
+        if (_FAST_PATH_LAT_MIN < lat1 < _FAST_PATH_LAT_MAX
+                and _FAST_PATH_LAT_MIN < lat2 < _FAST_PATH_LAT_MAX
+                and _FAST_PATH_LON_MIN < lon1 < _FAST_PATH_LON_MAX
+                and _FAST_PATH_LON_MIN < lon2 < _FAST_PATH_LON_MAX):
+            dlat = (lat2 - lat1) * _DEG2RAD
+            dlon = (lon2 - lon1) * _DEG2RAD * math.cos((lat1 + lat2) * (_DEG2RAD / 2))
+            return self.EARTH_RADIUS_KM * math.hypot(dlat, dlon)
+        
+        phi1, cos_phi1, lambda1 = _point_trig(lat1, lon1)
+        phi2, cos_phi2, lambda2 = _point_trig(lat2, lon2)
+        a = (math.sin((phi2 - phi1) / 2) ** 2
+             + cos_phi1 * cos_phi2 * math.sin((lambda2 - lambda1) / 2) ** 2)
+        return 2 * self.EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+    
+    def calculate_distances_vector(self, lats1, lons1, lats2, lons2) -> np.ndarray:
+        """
+        Calculate element-wise distances between two sets of GPS coordinates.
+        
+        Vectorized version of calculate_distance: pairs inside the Oslo box
+        use the equirectangular approximation, the rest use Haversine.
+        
+        Args:
+            lats1: Latitudes of the start points
+            lons1: Longitudes of the start points
+            lats2: Latitudes of the end points
+            lons2: Longitudes of the end points
+            
+        Returns:
+            Array of distances in kilometers (float64)
+        """
+        lats1 = np.asarray(lats1, dtype=np.float64)
+        lons1 = np.asarray(lons1, dtype=np.float64)
+        lats2 = np.asarray(lats2, dtype=np.float64)
+        lons2 = np.asarray(lons2, dtype=np.float64)
+        
+        dlat = np.radians(lats2 - lats1)
+        dlon = np.radians(lons2 - lons1)
+        distances = self.EARTH_RADIUS_KM * np.hypot(
+            dlat, dlon * np.cos(np.radians((lats1 + lats2) / 2)))
+        
+        outside = ~((_FAST_PATH_LAT_MIN < lats1) & (lats1 < _FAST_PATH_LAT_MAX)
+                    & (_FAST_PATH_LAT_MIN < lats2) & (lats2 < _FAST_PATH_LAT_MAX)
+                    & (_FAST_PATH_LON_MIN < lons1) & (lons1 < _FAST_PATH_LON_MAX)
+                    & (_FAST_PATH_LON_MIN < lons2) & (lons2 < _FAST_PATH_LON_MAX))
+        if outside.any():
+            a = (np.sin(dlat[outside] / 2) ** 2
+                 + np.cos(np.radians(lats1[outside])) * np.cos(np.radians(lats2[outside]))
+                 * np.sin(dlon[outside] / 2) ** 2)
+            distances[outside] = 2 * self.EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        return distances
     
     def calculate_travel_time(self, distance_km: float, transport_mode: str) -> float:
         """
@@ -238,12 +583,7 @@ class CourierOptimizer:
         Returns:
             Travel time in hours
         """
-        mode = transport_mode.upper()
-        if mode not in self.TRANSPORT_PARAMS:
-            raise ValueError(f"Invalid transport mode: {transport_mode}")
-        
-        speed = self.TRANSPORT_PARAMS[mode]['speed_kmh']
-        return distance_km / speed
+        return distance_km / _mode_lookup(_SPEED_KMH, transport_mode)
     
     def calculate_cost(self, distance_km: float, transport_mode: str) -> float:
         """
@@ -256,12 +596,7 @@ class CourierOptimizer:
         Returns:
             Cost in NOK
         """
-        mode = transport_mode.upper()
-        if mode not in self.TRANSPORT_PARAMS:
-            raise ValueError(f"Invalid transport mode: {transport_mode}")
-        
-        cost_per_km = self.TRANSPORT_PARAMS[mode]['cost_per_km']
-        return distance_km * cost_per_km
+        return distance_km * _mode_lookup(_COST_NOK_PER_KM, transport_mode)
     
     def calculate_co2(self, distance_km: float, transport_mode: str) -> float:
         """
@@ -274,61 +609,150 @@ class CourierOptimizer:
         Returns:
             CO2 emissions in grams
         """
-        mode = transport_mode.upper()
-        if mode not in self.TRANSPORT_PARAMS:
-            raise ValueError(f"Invalid transport mode: {transport_mode}")
+        return distance_km * _mode_lookup(_CO2_G_PER_KM, transport_mode)
+    
+    def _build_distance_matrix(self, coords: np.ndarray) -> np.ndarray:
+        """
+        Build the pairwise Haversine distance matrix for a set of points.
+        
+        Uses the compiled OpenMP kernel when the _courier_c extension is
+        built, otherwise NumPy broadcasting (tiled for large inputs).
         
-        co2_per_km = self.TRANSPORT_PARAMS[mode]['co2_g_per_km']
-        return distance_km * co2_per_km
+        Args:
+            coords: Array of shape (N, 2) with (latitude, longitude) in radians
+            
+        Returns:
+            Float32 array of shape (N, N) with distances in kilometers
+        """
+        if _courier_c is not None:
+            coords = np.ascontiguousarray(coords, dtype=np.float64)
+            matrix = np.empty((len(coords), len(coords)), dtype=np.float32)
+            _courier_c.haversine_pairwise(coords, matrix, self.EARTH_RADIUS_KM)
+            return matrix
+        
+        coords = np.asarray(coords, dtype=np.float64)
+        n = len(coords)
+        if n == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        
+        # The N x N work runs in float32. Offsets from the first point keep
+        # the float32 coordinate differences precise to about a millimetre.
+        lat = (coords[:, 0] - coords[0, 0]).astype(np.float32)
+        lon = (coords[:, 1] - coords[0, 1]).astype(np.float32)
+        cos_lat = np.cos(coords[:, 0]).astype(np.float32)
+        diameter = np.float32(2 * self.EARTH_RADIUS_KM)
+        
+        matrix = np.empty((n, n), dtype=np.float32)
+        tile = n if n <= self.DISTANCE_MATRIX_TILE_THRESHOLD else self.DISTANCE_MATRIX_TILE
+        
+        # Scratch blocks reused by every tile, so no per-tile temporaries
+        hav_lat = np.empty((tile, tile), dtype=np.float32)
+        hav_lon = np.empty((tile, tile), dtype=np.float32)
+        
+        for i0 in range(0, n, tile):
+            i1 = min(i0 + tile, n)
+            for j0 in range(0, n, tile):
+                j1 = min(j0 + tile, n)
+                a = hav_lat[:i1 - i0, :j1 - j0]
+                b = hav_lon[:i1 - i0, :j1 - j0]
+                
+                # a = sin^2(dlat / 2) + cos(lat1) * cos(lat2) * sin^2(dlon / 2)
+                np.subtract(lat[None, j0:j1], lat[i0:i1, None], out=a)
+                a *= 0.5
+                np.sin(a, out=a)
+                a *= a
+                np.subtract(lon[None, j0:j1], lon[i0:i1, None], out=b)
+                b *= 0.5
+                np.sin(b, out=b)
+                b *= b
+                b *= cos_lat[i0:i1, None]
+                b *= cos_lat[None, j0:j1]
+                a += b
+                
+                np.minimum(a, 1.0, out=a)
+                np.sqrt(a, out=a)
+                block = matrix[i0:i1, j0:j1]
+                np.arcsin(a, out=block)
+                block *= diameter
+        
+        return matrix
     
     @timer
-    def optimize_route(self, deliveries: List[Dict], transport_mode: str, 
-                      criteria: str) -> List[Dict]:
+    def optimize_route(self, deliveries: Deliveries, transport_mode: str, 
+                      criteria: str) -> Deliveries:
         """
         Optimize delivery route by sorting based on priority and proximity.
         
-        Sort by priority first (HIGH > MEDIUM > LOW),
-        then by distance from depot for deliveries with same priority.
+        Sort by priority first (HIGH > MEDIUM > LOW), then visit deliveries
+        with the same priority in nearest-neighbor order, starting from the
+        depot (or from the last stop of the previous priority group).
         
         Args:
-            deliveries: List of valid delivery dictionaries
+            deliveries: Valid deliveries (list of dicts or DeliveryBatch)
             transport_mode: 'CAR', 'BICYCLE', or 'WALKING'  
             criteria: 'FASTEST', 'CHEAPEST', or 'GREENEST'
             
         Returns:
-            List of deliveries in optimized order
+            Deliveries in optimized order, in the same container type
         """
+        # Nothing to order: skip the distance matrix and kernel setup
+        if len(deliveries) < 2:
+            return deliveries.copy()
+        
         self.logger.info(f"Optimizing route for {len(deliveries)} deliveries")
         self.logger.info(f"Transport: {transport_mode}, Criteria: {criteria}")
         
-        if not deliveries:
-            return []
+        n = len(deliveries)
         
-        if len(deliveries) == 1:
-            return deliveries.copy()
+        # Point 0 is the depot, point i + 1 is deliveries[i]
+        points = np.empty(n + 1,
+                          dtype=[('priority', np.int8), ('lat', np.float64), ('lon', np.float64)])
+        points[0] = (-1, self.DEPOT_LAT, self.DEPOT_LON)
+        points['priority'][1:] = _priority_codes(deliveries)
+        points['lat'][1:], points['lon'][1:] = _coordinate_columns(deliveries)
         
-        # Depot location (Oslo City Hall)
-        depot_lat = 59.9114
-        depot_lon = 10.7343
+        coords = np.radians(np.column_stack((points['lat'], points['lon'])))
+        distance_matrix = self._build_distance_matrix(coords)
         
-        # Priority ranking for sorting
-        priority_rank = {'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+        # Nearest-neighbor sequencing inside each priority group
+        order = nn_tour(distance_matrix, np.ascontiguousarray(points['priority'][1:]))
         
-        # Sort by priority first, then by distance from depot
-        sorted_deliveries = sorted(
-            deliveries,
-            key=lambda d: (
-                priority_rank.get(d.get('priority', 'LOW').upper(), 3),
-                self.calculate_distance(depot_lat, depot_lon, 
-                                       d['latitude'], d['longitude'])
-            )
-        )
+        if isinstance(deliveries, DeliveryBatch):
+            sorted_deliveries = deliveries.take(order)
+        else:
+            sorted_deliveries = [deliveries[i] for i in order.tolist()]
         
         self.logger.info("Route optimization complete")
         
         return sorted_deliveries
     
-    def calculate_route_metrics(self, route: List[Dict], transport_mode: str) -> Dict[str, float]:
+    def _route_leg_distances(self, route: Deliveries) -> np.ndarray:
+        """
+        Distances of every leg of a route, computed in one vectorized pass.
+        
+        Args:
+            route: Deliveries in route order (non-empty)
+            
+        Returns:
+            Array of len(route) + 1 leg distances in km: depot -> first stop,
+            stop -> stop, ..., last stop -> depot
+        """
+        if len(route) < _VECTORIZE_THRESHOLD:
+            # Short routes: a few scalar calls beat the NumPy array setup
+            points = [(self.DEPOT_LAT, self.DEPOT_LON)]
+            points.extend((d['latitude'], d['longitude']) for d in route)
+            points.append((self.DEPOT_LAT, self.DEPOT_LON))
+            return np.array([self.calculate_distance(*a, *b) for a, b in zip(points, points[1:])],
+                            dtype=np.float64)
+        
+        lats = np.empty(len(route) + 2, dtype=np.float64)
+        lons = np.empty(len(route) + 2, dtype=np.float64)
+        lats[0] = lats[-1] = self.DEPOT_LAT
+        lons[0] = lons[-1] = self.DEPOT_LON
+        lats[1:-1], lons[1:-1] = _coordinate_columns(route)
+        return self.calculate_distances_vector(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    
+    def calculate_route_metrics(self, route: Deliveries, transport_mode: str) -> Dict[str, float]:
         """
         Calculate total metrics for a delivery route.
         
@@ -336,7 +760,7 @@ class CourierOptimizer:
         the entire route from depot through all deliveries and back to depot.
         
         Args:
-            route: List of delivery dictionaries in route order
+            route: Deliveries in route order (list of dicts or DeliveryBatch)
             transport_mode: Transport mode to use (CAR, BICYCLE, WALKING)
             
         Returns:
@@ -354,32 +778,8 @@ class CourierOptimizer:
                 'total_co2_grams': 0.0
             }
         
-        # Depot location (Oslo City Hall)
-        depot_lat = 59.9114
-        depot_lon = 10.7343
-        
-        total_distance = 0.0
-        current_lat = depot_lat
-        current_lon = depot_lon
-        
-        # Calculate distance through all deliveries
-        for delivery in route:
-            distance = self.calculate_distance(
-                current_lat, current_lon,
-                delivery['latitude'], delivery['longitude']
-            )
-            total_distance += distance
-            current_lat = delivery['latitude']
-            current_lon = delivery['longitude']
-        
-        # Return to depot
-        distance_back = self.calculate_distance(
-            current_lat, current_lon,
-            depot_lat, depot_lon
-        )
-        total_distance += distance_back
-        
-        # Calculate metrics based on total distance
+        # One pass over the leg array; the other totals scale the distance
+        total_distance = float(self._route_leg_distances(route).sum())
         total_time = self.calculate_travel_time(total_distance, transport_mode)
         total_cost = self.calculate_cost(total_distance, transport_mode)
         total_co2 = self.calculate_co2(total_distance, transport_mode)
@@ -396,6 +796,9 @@ class CourierOptimizer:
         """
         Read deliveries from CSV file.
         
+        Set COURIER_FAST_IO=1 to parse with PyArrow (if installed); the
+        resulting DataFrame has the same columns and dtypes.
+        
         Args:
             filepath: Path to deliveries CSV file
             
@@ -406,10 +809,11 @@ class CourierOptimizer:
             FileNotFoundError: If file doesn't exist
             ValueError: If CSV has invalid format
         """
-        self.logger.info(f"Reading CSV from: {filepath}")
+        engine = _csv_engine()
+        self.logger.info(f"Reading CSV from: {filepath} (engine: {engine or 'pandas'})")
         
         try:
-            df = pd.read_csv(filepath)
+            df = pd.read_csv(filepath, engine=engine)
             
             # Check required columns
             required_columns = {'customer', 'latitude', 'longitude', 'priority', 'weight_kg'}
@@ -429,69 +833,108 @@ class CourierOptimizer:
         except Exception as e:
             raise ValueError(f"Error reading CSV file: {str(e)}")
     
-    @timer
-    def write_route_csv(self, route: List[Dict], metrics: Dict[str, float], 
-                       filepath: str, transport_mode: str) -> None:
+    def _ensure_dir(self, filepath) -> None:
+        """Create the parent directory of filepath, once per directory."""
+        directory = Path(filepath).parent
+        if directory not in self._mkdir_cache:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(directory)
+    
+    def _write_csv_chunks(self, rows: Iterable[Dict[str, Any]], columns: List[str],
+                          filepath: str, chunk_size: int) -> int:
         """
-        Write optimized route to CSV file with detailed metrics.
+        Stream row dicts to a CSV file, materializing at most chunk_size rows at a time.
+        
+        The parent directory is created if it does not exist yet.
         
         Args:
-            route: List of deliveries in optimized order
-            metrics: Dictionary with total route metrics
-            filepath: Output CSV file path
-            transport_mode: Transport mode used
+            rows: Iterable of row dictionaries
+            columns: Column order (header is always written, even with no rows)
+            filepath: Output CSV file path (str or Path)
+            chunk_size: Maximum number of rows converted per write
+            
+        Returns:
+            Number of rows written
         """
-        self.logger.info(f"Writing route to: {filepath}")
+        self._ensure_dir(filepath)
+        rows = iter(rows)
+        written = 0
         
-        if not route:
-            # Write empty file with headers only
-            df = pd.DataFrame(columns=['stop_number', 'customer', 'latitude', 'longitude', 
-                                      'priority', 'weight_kg', 'distance_km', 'cumulative_distance_km',
-                                      'eta_hours', 'cost_nok', 'co2_grams'])
-            df.to_csv(filepath, index=False)
-            return
+        with open(filepath, 'w', newline='') as f:
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+            
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                pd.DataFrame(chunk, columns=columns).to_csv(f, header=False, index=False)
+                written += len(chunk)
+        
+        return written
+    
+    def _iter_route_rows(self, route: Deliveries, transport_mode: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one output row per stop with segment and cumulative metrics.
         
-        # Depot location
-        depot_lat = 59.9114
-        depot_lon = 10.7343
+        Segment distances and their per-mode metrics are computed as arrays
+        up front; the loop only assembles rows.
         
-        # Build route data with cumulative metrics
-        route_data = []
-        cumulative_distance = 0.0
-        prev_lat, prev_lon = depot_lat, depot_lon
+        Args:
+            route: Deliveries in optimized order
+            transport_mode: Transport mode used
+        """
+        if not route:
+            return
         
-        for i, delivery in enumerate(route, 1):
-            # Distance from previous point
-            segment_distance = self.calculate_distance(
-                prev_lat, prev_lon,
-                delivery['latitude'], delivery['longitude']
-            )
-            cumulative_distance += segment_distance
-            
-            # Calculate segment metrics
-            segment_time = self.calculate_travel_time(segment_distance, transport_mode)
-            segment_cost = self.calculate_cost(segment_distance, transport_mode)
-            segment_co2 = self.calculate_co2(segment_distance, transport_mode)
-            
-            route_data.append({
+        # Legs into each stop (the return leg to the depot is not a row)
+        segment_distances = self._route_leg_distances(route)[:-1]
+        cumulative_distances = np.cumsum(segment_distances)
+        segment_times = self.calculate_travel_time(segment_distances, transport_mode)
+        segment_costs = self.calculate_cost(segment_distances, transport_mode)
+        segment_co2 = self.calculate_co2(segment_distances, transport_mode)
+        
+        for i, (delivery, distance, cumulative, time, cost, co2) in enumerate(zip(
+                route, segment_distances.tolist(), cumulative_distances.tolist(),
+                segment_times.tolist(), segment_costs.tolist(), segment_co2.tolist()), 1):
+            yield {
                 'stop_number': i,
                 'customer': delivery['customer'],
                 'latitude': delivery['latitude'],
                 'longitude': delivery['longitude'],
                 'priority': delivery['priority'],
                 'weight_kg': delivery['weight_kg'],
-                'distance_km': round(segment_distance, 2),
-                'cumulative_distance_km': round(cumulative_distance, 2),
-                'eta_hours': round(segment_time, 2),
-                'cost_nok': round(segment_cost, 2),
-                'co2_grams': round(segment_co2, 2)
-            })
-            
-            prev_lat, prev_lon = delivery['latitude'], delivery['longitude']
+                'distance_km': round(distance, 2),
+                'cumulative_distance_km': round(cumulative, 2),
+                'eta_hours': round(time, 2),
+                'cost_nok': round(cost, 2),
+                'co2_grams': round(co2, 2)
+            }
+    
+    @timer
+    def write_route_csv(self, route: Deliveries, metrics: Dict[str, float], 
+                       filepath: str, transport_mode: str,
+                       chunk_size: Optional[int] = None) -> None:
+        """
+        Write optimized route to CSV file with detailed metrics.
         
-        # Create DataFrame and save
-        df = pd.DataFrame(route_data)
-        df.to_csv(filepath, index=False)
+        Rows are generated and written in chunks, so memory stays bounded
+        for very long routes.
+        
+        Args:
+            route: List of deliveries in optimized order
+            metrics: Dictionary with total route metrics
+            filepath: Output CSV file path
+            transport_mode: Transport mode used
+            chunk_size: Rows per write (defaults to CSV_CHUNK_SIZE)
+        """
+        self.logger.info(f"Writing route to: {filepath}")
+        
+        rows = self._iter_route_rows(route, transport_mode)
+        self._write_csv_chunks(rows, self.ROUTE_CSV_COLUMNS, filepath,
+                               chunk_size or self.CSV_CHUNK_SIZE)
+        
+        if not route:
+            return
         
         self.logger.info(f"Successfully wrote {len(route)} deliveries to {filepath}")
         
@@ -503,36 +946,36 @@ class CourierOptimizer:
         print(f"   Total cost: {metrics['total_cost_nok']} NOK")
         print(f"   Total CO2: {metrics['total_co2_grams']} grams ({metrics['total_co2_grams']/1000:.2f} kg)")
     
-    def write_rejected_csv(self, invalid_deliveries: List[Dict], filepath: str) -> None:
+    def write_rejected_csv(self, invalid_deliveries: Deliveries, filepath: str,
+                           chunk_size: Optional[int] = None) -> None:
         """
         Write rejected deliveries to CSV file with warning messages.
         
+        Rows are written in chunks, so memory stays bounded for large inputs.
+        
         Args:
             invalid_deliveries: List of invalid delivery dictionaries with warnings
             filepath: Output CSV file path
+            chunk_size: Rows per write (defaults to CSV_CHUNK_SIZE)
         """
-        if not invalid_deliveries:
-            # Write empty file with headers
-            df = pd.DataFrame(columns=['customer', 'latitude', 'longitude', 
-                                      'priority', 'weight_kg', 'warnings'])
-            df.to_csv(filepath, index=False)
-            print(f"\n✅ No rejected deliveries")
-            return
-        
         # Prepare data with warnings as string
-        rejected_data = []
-        for delivery in invalid_deliveries:
-            rejected_data.append({
+        rows = (
+            {
                 'customer': delivery.get('customer', ''),
                 'latitude': delivery.get('latitude', ''),
                 'longitude': delivery.get('longitude', ''),
                 'priority': delivery.get('priority', ''),
                 'weight_kg': delivery.get('weight_kg', ''),
                 'warnings': ' | '.join(delivery.get('warnings', []))
-            })
+            }
+            for delivery in invalid_deliveries
+        )
+        self._write_csv_chunks(rows, self.REJECTED_CSV_COLUMNS, filepath,
+                               chunk_size or self.CSV_CHUNK_SIZE)
         
-        df = pd.DataFrame(rejected_data)
-        df.to_csv(filepath, index=False)
+        if not invalid_deliveries:
+            print(f"\n✅ No rejected deliveries")
+            return
         
         print(f"\n⚠️  Rejected deliveries saved to: {filepath}")
         print(f"   Total rejected: {len(invalid_deliveries)}")
@@ -0,0 +1,191 @@
+"""
+Delivery data containers for CourierOptimizer.
+
+Deliveries are stored column-wise (structure of arrays) so validation,
+distance and routing code can work on whole NumPy columns at once.
+Single deliveries are exposed as slotted Delivery records.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(slots=True)
+class Delivery:
+    """
+    One delivery record.
+
+    Slotted, so each record is a fixed-size object rather than a dict.
+    It still supports the dict-style access the rest of the code uses:
+
+        delivery.customer
+        delivery['customer']
+        delivery.get('priority', 'LOW')
+        dict(delivery)
+    """
+
+    customer: str
+    latitude: float
+    longitude: float
+    priority: str
+    weight_kg: float
+    warnings: Sequence[str] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field by name, or default if there is no such field."""
+        return getattr(self, key, default)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names (lets dict(delivery) work)."""
+        return DELIVERY_FIELDS + ('warnings',)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """(field, value) pairs, like dict.items()."""
+        return [(name, getattr(self, name)) for name in self.keys()]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict."""
+        return dict(self)
+
+
+# Fields every Delivery must have, in constructor order
+DELIVERY_FIELDS = tuple(f.name for f in fields(Delivery) if f.name != 'warnings')
+
+
+class DeliveryBatch:
+    """
+    Column-oriented collection of deliveries.
+
+    Each field (customer, latitude, longitude, priority, weight_kg, ...) is
+    one NumPy array. Numeric columns are float64; text columns are object
+    arrays.
+
+    The batch still behaves like the list of deliveries it replaces:
+    len(), iteration and integer indexing yield per-delivery records
+    (Delivery objects when the columns are exactly the Delivery fields,
+    dicts otherwise, so extra CSV columns are kept), and slicing returns
+    a new batch. Indexing with a column name returns the column array:
+
+        batch[0]['customer']   # one record
+        batch[:10]             # first ten deliveries (DeliveryBatch)
+        batch['latitude']      # whole column (np.ndarray)
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """
+        Create a batch from equal-length column arrays.
+
+        Args:
+            columns: Mapping of field name to 1-D array
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns must have equal length, got {sorted(lengths)}")
+
+        self._columns = {name: np.asarray(values) for name, values in columns.items()}
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> 'DeliveryBatch':
+        """Create a batch from a DataFrame (one array per column)."""
+        return cls({name: frame[name].to_numpy() for name in frame.columns})
+
+    @classmethod
+    def from_arrow(cls, table) -> 'DeliveryBatch':
+        """Create a batch from a pyarrow.Table without going through pandas."""
+        return cls({name: table[name].to_numpy() for name in table.column_names})
+
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]]) -> 'DeliveryBatch':
+        """Create a batch from a list of delivery dicts."""
+        return cls.from_frame(pd.DataFrame(list(records)))
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of the stored fields."""
+        return list(self._columns)
+
+    def column(self, name: str) -> np.ndarray:
+        """Get the array for one field."""
+        return self._columns[name]
+
+    def with_column(self, name: str, values) -> 'DeliveryBatch':
+        """Return a new batch with a field added or replaced."""
+        columns = dict(self._columns)
+        columns[name] = values
+        return DeliveryBatch(columns)
+
+    def take(self, indices) -> 'DeliveryBatch':
+        """Return a new batch with the deliveries at the given positions, in that order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return DeliveryBatch({name: values[indices] for name, values in self._columns.items()})
+
+    def copy(self) -> 'DeliveryBatch':
+        """Return a copy with independent column arrays."""
+        return DeliveryBatch({name: values.copy() for name, values in self._columns.items()})
+
+    def _record_fields(self) -> Union[List[str], None]:
+        """
+        Column order for Delivery(*row), or None if records must be dicts.
+
+        Records are dicts when a Delivery field is missing or when there
+        are columns Delivery has no field for (they would be dropped).
+        """
+        if not all(name in self._columns for name in DELIVERY_FIELDS):
+            return None
+        if any(name not in DELIVERY_FIELDS and name != 'warnings' for name in self._columns):
+            return None
+        names = list(DELIVERY_FIELDS)
+        if 'warnings' in self._columns:
+            names.append('warnings')
+        return names
+
+    def record(self, index: int) -> Union[Delivery, Dict[str, Any]]:
+        """Build the record for one delivery (Python scalars, not NumPy scalars)."""
+        names = self._record_fields()
+        if names is None:
+            return {name: values.item(index) for name, values in self._columns.items()}
+        return Delivery(*(self._columns[name].item(index) for name in names))
+
+    def as_records(self) -> List[Union[Delivery, Dict[str, Any]]]:
+        """Rebuild the list-of-records form."""
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Union[Delivery, Dict[str, Any]]]:
+        names = self._record_fields()
+        if names is None:
+            names = list(self._columns)
+            for row in zip(*(values.tolist() for values in self._columns.values())):
+                yield dict(zip(names, row))
+            return
+        for row in zip(*(self._columns[name].tolist() for name in names)):
+            yield Delivery(*row)
+
+    def __getitem__(self, key: Union[int, slice, str]):
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, slice):
+            return self.take(np.arange(self._length)[key])
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError(f"Delivery index {key} out of range for {self._length} deliveries")
+        return self.record(key)
+
+    def __repr__(self) -> str:
+        return f"DeliveryBatch({self._length} deliveries, columns={self.columns})"
@@ -223,7 +223,7 @@ def demo_all():
     print("="*60 + "\n")
     print("💡 What we've demonstrated:")
     print("   ✅ Delivery validation (business rules)")
-    print("   ✅ GPS distance calculation (geopy)")
+    print("   ✅ GPS distance calculation (Haversine)")
     print("   ✅ Transport mode comparisons (time, cost, CO2)")
     print("   ✅ Route optimization (priority + proximity)")
     print("   ✅ Route metrics calculation (FASTEST, CHEAPEST, GREENEST)")
@@ -0,0 +1,455 @@
+"""
+Generation step kernels for Conway's Game of Life.
+
+A kernel reads the current cells (uint8 array, shape (height, width)) and
+writes the next generation into a second array of the same shape, using
+toroidal wrap at the edges.
+
+If the optional Cython extension (_step_c) is built it is used first. If
+Numba is installed the scalar kernel is JIT-compiled, with rows split
+across threads. Without either the grid is stepped with NumPy in strips of
+TILE_HEIGHT rows so the working set stays in cache; a ProcessStep steps
+bands of rows in worker processes. A bit-parallel kernel that works on
+whole rows packed into Python ints, and a sparse kernel whose cost scales
+with the number of living cells, are also available. If CuPy
+is installed, large grids can be stepped on the GPU (see advance_cupy).
+KERNELS maps backend names to kernels.
+"""
+
+import atexit
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+except ImportError:  # Numba is optional
+    numba = None
+    prange = range
+
+try:
+    from ._step_c import step_toroidal as _step_c
+except ImportError:  # Compiled kernel not built; see setup.py
+    _step_c = None
+
+try:
+    import cupy
+except ImportError:  # CuPy (GPU) is optional
+    cupy = None
+
+
+# (dx, dy) offsets of the 8 surrounding cells
+NEIGHBOR_OFFSETS = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                         if (dx, dy) != (0, 0))
+
+
+def neighbor_counts(cells):
+    """
+    Count living neighbors for every cell (toroidal wrap).
+    
+    The 3x3 sum is split into a vertical and a horizontal pass: each
+    cell's column of three (itself, above, below) is summed from two
+    wrapped row rolls, then three neighboring column sums are added from
+    two column rolls and the cell itself is subtracted. That is 4 rolls
+    and 5 adds instead of 8 shifted copies and 8 adds.
+    
+    Args:
+        cells: uint8 array of shape (height, width)
+    
+    Returns:
+        uint8 array of the same shape with neighbor counts (0-8)
+    """
+    column = np.roll(cells, 1, axis=0)
+    column += cells
+    column += np.roll(cells, -1, axis=0)
+    
+    counts = np.roll(column, 1, axis=1)
+    counts += column
+    counts += np.roll(column, -1, axis=1)
+    counts -= cells
+    return counts
+
+
+def _count_neighbors_scalar(cells, x, y):
+    """
+    Living neighbors of the cell at (x, y) (toroidal wrap).
+    
+    The Numba compilation target for Grid.count_neighbors; only used when
+    Numba is installed, as the compiled call is cheaper than eight
+    interpreted cell reads.
+    
+    x and y must be in range (Grid.count_neighbors wraps them first).
+    """
+    height, width = cells.shape
+    left = (x - 1) % width
+    right = (x + 1) % width
+    up = (y - 1) % height
+    down = (y + 1) % height
+    return (int(cells[up, left]) + int(cells[up, x]) + int(cells[up, right])
+            + int(cells[y, left]) + int(cells[y, right])
+            + int(cells[down, left]) + int(cells[down, x]) + int(cells[down, right]))
+
+
+def _step_scalar(src, dst):
+    """
+    One generation as plain loops over rows and columns (the Numba compilation target).
+    
+    Args:
+        src: Current cells, uint8 array of shape (height, width)
+        dst: Output array of the same shape (overwritten)
+    """
+    height, width = src.shape
+    for y in prange(height):
+        up = src[(y - 1) % height]
+        mid = src[y]
+        down = src[(y + 1) % height]
+        out = dst[y]
+        
+        # Interior columns use plain offsets so the loop stays vectorizable
+        for x in range(1, width - 1):
+            n = (up[x - 1] + up[x] + up[x + 1]
+                 + mid[x - 1] + mid[x + 1]
+                 + down[x - 1] + down[x] + down[x + 1])
+            # Birth with exactly 3 neighbors, survival with 2 or 3 (branch-free)
+            out[x] = (n == 3) | ((n == 2) & (mid[x] == 1))
+        
+        # First and last column wrap around
+        for x in (0, width - 1):
+            left = (x - 1) % width
+            right = (x + 1) % width
+            n = (up[left] + up[x] + up[right]
+                 + mid[left] + mid[right]
+                 + down[left] + down[x] + down[right])
+            out[x] = (n == 3) | ((n == 2) & (mid[x] == 1))
+
+
+def _step_numpy(src, dst):
+    """
+    One generation with whole-array NumPy operations.
+    
+    Same contract and result as _step_scalar.
+    """
+    n = neighbor_counts(src)
+    np.logical_or(n == 3, (src == 1) & (n == 2), out=dst, casting='unsafe')
+
+
+# Rows per strip in TiledStep
+TILE_HEIGHT = 64
+
+
+class TiledStep:
+    """
+    Step kernel that processes the grid in strips of tile_height rows.
+    
+    Each strip is copied with its wrapped halo (one row above and below,
+    one column left and right) into a small padded scratch buffer, and the
+    neighbor counts go into a second scratch buffer. Both are allocated
+    once and reused for every strip and every generation, so the hot rows
+    stay in cache and nothing is allocated per step.
+    
+    Same contract and result as _step_scalar.
+    """
+    
+    def __init__(self, tile_height: int = TILE_HEIGHT):
+        self.tile_height = tile_height
+        self._padded = None
+        self._counts = None
+        self._survive = None
+    
+    def _scratch(self, rows: int, width: int) -> None:
+        """(Re)allocate the scratch buffers if the strip shape changed."""
+        if self._padded is None or self._padded.shape != (rows + 2, width + 2):
+            self._padded = np.empty((rows + 2, width + 2), dtype=np.uint8)
+            self._counts = np.empty((rows, width), dtype=np.uint8)
+            self._survive = np.empty((rows, width), dtype=bool)
+    
+    def __call__(self, src, dst):
+        height, width = src.shape
+        tile = min(self.tile_height, height)
+        self._scratch(tile, width)
+        
+        for y0 in range(0, height, tile):
+            y1 = min(y0 + tile, height)
+            rows = y1 - y0
+            padded = self._padded[:rows + 2]
+            counts = self._counts[:rows]
+            survive = self._survive[:rows]
+            
+            # Strip plus wrapped halo rows and columns
+            padded[1:-1, 1:-1] = src[y0:y1]
+            padded[0, 1:-1] = src[y0 - 1]
+            padded[-1, 1:-1] = src[y1 % height]
+            padded[:, 0] = padded[:, -2]
+            padded[:, -1] = padded[:, 1]
+            
+            np.add(padded[:-2, :-2], padded[:-2, 1:-1], out=counts)
+            counts += padded[:-2, 2:]
+            counts += padded[1:-1, :-2]
+            counts += padded[1:-1, 2:]
+            counts += padded[2:, :-2]
+            counts += padded[2:, 1:-1]
+            counts += padded[2:, 2:]
+            
+            # Sum == 3, or sum == 2 on a living cell
+            np.equal(counts, 2, out=survive)
+            np.logical_and(survive, padded[1:-1, 1:-1], out=survive)
+            out = dst[y0:y1]
+            np.equal(counts, 3, out=out, casting='unsafe')
+            out |= survive
+
+
+# Shared-memory (src, dst) views of a ProcessStep, attached in each worker
+_worker_buffers = None
+
+
+def _attach_shared(src_name, dst_name, shape):
+    """ProcessStep worker initializer: map the shared cell buffers."""
+    global _worker_buffers
+    src_shm = shared_memory.SharedMemory(name=src_name)
+    dst_shm = shared_memory.SharedMemory(name=dst_name)
+    # The SharedMemory objects are kept so the mappings stay alive
+    _worker_buffers = (src_shm, dst_shm,
+                       np.ndarray(shape, dtype=np.uint8, buffer=src_shm.buf),
+                       np.ndarray(shape, dtype=np.uint8, buffer=dst_shm.buf))
+
+
+def _step_band(y0, y1):
+    """ProcessStep worker task: next generation of rows y0 to y1 - 1."""
+    _, _, src, dst = _worker_buffers
+    # The band plus one wrapped halo row above and below
+    rows = np.take(src, np.arange(y0 - 1, y1 + 1), axis=0, mode='wrap')
+    counts = neighbor_counts(rows)[1:-1]
+    np.logical_or(counts == 3, (rows[1:-1] == 1) & (counts == 2),
+                  out=dst[y0:y1], casting='unsafe')
+
+
+class ProcessStep:
+    """
+    Step kernel that evolves horizontal bands of rows in worker processes.
+    
+    The current cells are copied into a shared-memory block that every
+    worker maps, each worker writes its band of the next generation into
+    a second shared block, and the result is copied out. Only band
+    bounds are sent between processes, so the IPC cost does not grow
+    with the grid. The pool and shared blocks are created on the first
+    call and kept until the grid shape changes or close() is called
+    (or the interpreter exits). GameOfLife(backend='processes') creates
+    one per game, so games of different shapes do not share a pool.
+    
+    Worth it for large grids on machines with several cores; for small
+    grids the per-step task dispatch costs more than the step. Workers
+    are spawned, so a script using this kernel needs the usual
+    if __name__ == '__main__' guard.
+    
+    Same contract and result as _step_scalar.
+    """
+    
+    def __init__(self, workers: int = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._shared = ()
+        self._src = None
+        self._dst = None
+    
+    def _start(self, shape) -> None:
+        """(Re)create the shared blocks and the worker pool for a grid shape."""
+        self.close()
+        atexit.register(self.close)
+        size = max(shape[0] * shape[1], 1)
+        self._shared = (shared_memory.SharedMemory(create=True, size=size),
+                        shared_memory.SharedMemory(create=True, size=size))
+        self._src, self._dst = (np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+                                for shm in self._shared)
+        # Spawned, not forked: forking after Numba's thread pool has started
+        # can deadlock
+        self._pool = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_attach_shared,
+            initargs=(self._shared[0].name, self._shared[1].name, shape))
+    
+    def close(self) -> None:
+        """Shut down the workers and free the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        # The array views must go before the blocks they map can be closed
+        self._src = self._dst = None
+        for shm in self._shared:
+            shm.close()
+            shm.unlink()
+        self._shared = ()
+        atexit.unregister(self.close)
+    
+    def __call__(self, src, dst):
+        if self._src is None or self._src.shape != src.shape:
+            self._start(src.shape)
+        
+        height = src.shape[0]
+        band = -(-height // self.workers)
+        self._src[:] = src
+        tasks = [self._pool.submit(_step_band, y0, min(y0 + band, height))
+                 for y0 in range(0, height, band)]
+        for task in tasks:
+            task.result()
+        dst[:] = self._dst
+
+
+def _step_bits(top, mid, bot, width):
+    """
+    Next state of one row, with every row packed into an int (bit x = cell x).
+    
+    The 8 neighbor words are added bit-parallel with a half-adder chain
+    into a 3-bit sum (s2 s1 s0), so all cells of the row are updated by a
+    fixed number of bitwise operations instead of per-cell lookups.
+    
+    Args:
+        top: Row above (wrapped)
+        mid: The row being updated
+        bot: Row below (wrapped)
+        width: Number of cells in a row
+    
+    Returns:
+        Packed next state of the row
+    """
+    mask = (1 << width) - 1
+    high = width - 1
+    s0 = s1 = s2 = 0
+    for i, row in enumerate((top, mid, bot)):
+        # Neighbors to the left and right, aligned to each cell (toroidal wrap)
+        west = ((row << 1) | (row >> high)) & mask
+        east = (row >> 1) | ((row & 1) << high)
+        # By position: the rows can be equal ints (or the same row on short grids)
+        for word in ((west, east) if i == 1 else (west, row, east)):
+            carry0 = s0 & word
+            s0 ^= word
+            carry1 = s1 & carry0
+            s1 ^= carry0
+            # A sum of 8 wraps to 0, which is dead like any sum >= 4
+            s2 ^= carry1
+    
+    # Sum == 3, or sum == 2 on a living cell
+    return s1 & ~s2 & (s0 | mid)
+
+
+def _step_bitboard(src, dst):
+    """
+    One generation by packing each row into an int and calling _step_bits.
+    
+    Same contract and result as _step_scalar.
+    """
+    height, width = src.shape
+    rows = [int.from_bytes(packed.tobytes(), 'little')
+            for packed in np.packbits(src, axis=1, bitorder='little')]
+    
+    row_bytes = (width + 7) // 8
+    packed = np.empty((height, row_bytes), dtype=np.uint8)
+    for y in range(height):
+        word = _step_bits(rows[y - 1], rows[y], rows[(y + 1) % height], width)
+        packed[y] = np.frombuffer(word.to_bytes(row_bytes, 'little'), dtype=np.uint8)
+    dst[:] = np.unpackbits(packed, axis=1, count=width, bitorder='little')
+
+
+def _step_sparse(src, dst):
+    """
+    One generation visiting only living cells and their neighbors.
+    
+    Each living cell adds 1 to the count of its 8 (wrapped) neighbors;
+    only cells that received a count can be alive next generation. The
+    Python work is O(living cells), which beats scanning every cell when
+    a large grid is mostly empty.
+    
+    Same contract and result as _step_scalar.
+    """
+    height, width = src.shape
+    ys, xs = np.nonzero(src)
+    alive = set(zip(xs.tolist(), ys.tolist()))
+    
+    counts = Counter()
+    for x, y in alive:
+        for dx, dy in NEIGHBOR_OFFSETS:
+            counts[((x + dx) % width, (y + dy) % height)] += 1
+    
+    dst.fill(0)
+    survivors = [cell for cell, n in counts.items() if n == 3 or (n == 2 and cell in alive)]
+    if survivors:
+        next_xs, next_ys = zip(*survivors)
+        dst[next_ys, next_xs] = 1
+
+
+def _generations_cupy(cells, generations):
+    """
+    Advance a CuPy device array by the given number of generations.
+    
+    neighbor_counts is written against the NumPy API, and np.roll on a
+    CuPy array dispatches to cupy.roll, so every generation runs on the
+    GPU without leaving device memory.
+    """
+    for _ in range(generations):
+        n = neighbor_counts(cells)
+        cells = ((n == 3) | ((n == 2) & (cells == 1))).astype(cupy.uint8)
+    return cells
+
+
+def _step_cupy(src, dst):
+    """
+    One generation on the GPU.
+    
+    Same contract and result as _step_scalar. Copying the grid to the
+    device and back costs more than the step itself, so for many
+    generations use advance_cupy, which copies only once each way.
+    """
+    dst[:] = cupy.asnumpy(_generations_cupy(cupy.asarray(src), 1))
+
+
+def advance_cupy(cells, generations):
+    """
+    Cells after the given number of generations, computed on the GPU.
+    
+    Args:
+        cells: Current cells, uint8 array of shape (height, width)
+        generations: Number of generations to advance (>= 0)
+    
+    Returns:
+        New uint8 NumPy array of the same shape
+    """
+    return cupy.asnumpy(_generations_cupy(cupy.asarray(cells), generations))
+
+
+if numba is not None:
+    HAS_NUMBA = True
+    _step_numba = numba.njit(cache=True, parallel=True, boundscheck=False)(_step_scalar)
+    count_neighbors = numba.njit(cache=True, boundscheck=False)(_count_neighbors_scalar)
+else:
+    HAS_NUMBA = False
+    _step_numba = None
+    count_neighbors = None
+
+HAS_C = _step_c is not None
+HAS_CUPY = cupy is not None
+
+if HAS_C:
+    step = _step_c
+elif HAS_NUMBA:
+    step = _step_numba
+else:
+    step = TiledStep()
+
+# Step kernels by backend name ('auto' is the fastest one available)
+KERNELS = {
+    'auto': step,
+    'numpy': _step_numpy,
+    'tiled': step if isinstance(step, TiledStep) else TiledStep(),
+    'bits': _step_bitboard,
+    'sparse': _step_sparse,
+}
+if _step_numba is not None:
+    KERNELS['numba'] = _step_numba
+if _step_c is not None:
+    KERNELS['c'] = _step_c
+if HAS_CUPY:
+    KERNELS['cupy'] = _step_cupy
@@ -0,0 +1,61 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled generation step kernel for Conway's Game of Life.
+
+Optional C extension (build with `python setup.py build_ext --inplace`).
+When it is not built, _kernels uses the Numba or NumPy kernels, which
+produce the same results. Unlike Numba there is no JIT warm-up on the
+first step.
+
+Rows are split across cores with OpenMP.
+"""
+
+from cython.parallel cimport prange
+
+
+def step_toroidal(const unsigned char[:, ::1] src, unsigned char[:, ::1] dst):
+    """
+    Write the next generation of src into dst (toroidal wrap).
+
+    Same contract and result as _kernels._step_scalar.
+
+    Args:
+        src: Current cells, uint8 array of shape (height, width), 1 = alive
+        dst: Output array of the same shape (overwritten)
+    """
+    cdef Py_ssize_t height = src.shape[0]
+    cdef Py_ssize_t width = src.shape[1]
+    cdef Py_ssize_t y, x, left, right, edge
+    cdef const unsigned char* up
+    cdef const unsigned char* mid
+    cdef const unsigned char* down
+    cdef unsigned char* out
+    cdef unsigned char n
+
+    if dst.shape[0] != height or dst.shape[1] != width:
+        raise ValueError(f"dst must have shape ({height}, {width})")
+
+    for y in prange(height, nogil=True):
+        # Plain row pointers so the inner loop is simple C the compiler can vectorize
+        up = &src[height - 1 if y == 0 else y - 1, 0]
+        mid = &src[y, 0]
+        down = &src[0 if y == height - 1 else y + 1, 0]
+        out = &dst[y, 0]
+
+        # Interior columns need no wrap. (n | cell) == 3 is exactly
+        # "3 neighbors, or 2 neighbors and alive" without branches.
+        for x in range(1, width - 1):
+            n = (up[x - 1] + up[x] + up[x + 1]
+                 + mid[x - 1] + mid[x + 1]
+                 + down[x - 1] + down[x] + down[x + 1])
+            out[x] = (n | mid[x]) == 3
+
+        # First and last column wrap around
+        for edge in range(2):
+            x = 0 if edge == 0 else width - 1
+            left = width - 1 if x == 0 else x - 1
+            right = 0 if x == width - 1 else x + 1
+            n = (up[left] + up[x] + up[right]
+                 + mid[left] + mid[right]
+                 + down[left] + down[x] + down[right])
+            out[x] = (n | mid[x]) == 3
@@ -4,9 +4,19 @@ Implements the core logic for Conway's rules and generation evolution.
 """
 
 from typing import List, Tuple
+
+import numpy as np
+
+from . import _kernels, hashlife
 from .grid import Grid
 
 
+# Next state for every (alive, neighbor count) pair, indexed by
+# (alive << 4) | count; entries for counts above 8 are never used
+_RULE_LUT = bytes(1 if (alive and count in (2, 3)) or (not alive and count == 3) else 0
+                  for alive in (0, 1) for count in range(16))
+
+
 class GameOfLife:
     """
     Main game engine for Conway's Game of Life.
@@ -18,18 +28,42 @@ class GameOfLife:
     4. Birth: Dead cell with exactly 3 neighbors becomes alive
     """
     
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, backend: str = 'auto'):
         """
         Initialize a new Game of Life simulation.
         
         Args:
             width: Grid width in cells
             height: Grid height in cells
+            backend: Step kernel to use: 'auto' (fastest available),
+                'numpy', 'tiled' (cache-sized row strips), 'processes'
+                (row bands in worker processes; call close() when
+                done), 'bits' (bit-parallel rows), 'sparse' (living
+                cells only, for mostly empty grids), 'numba' (if
+                installed), 'c' (if the Cython extension is built),
+                'cupy' (GPU, if CuPy is installed) or 'hashlife'
+                ('auto' for single steps, HashLife for advance())
+        
+        Raises:
+            ValueError: If the backend is not available
         """
+        if backend not in _kernels.KERNELS and backend not in ('processes', 'hashlife'):
+            available = ', '.join([*_kernels.KERNELS, 'processes', 'hashlife'])
+            raise ValueError(f"Unknown backend '{backend}'. Available: {available}")
+        
         self.grid = Grid(width, height)
         self.generation = 0
         self.width = width
         self.height = height
+        self.backend = backend
+        if backend == 'processes':
+            # Own worker pool and shared memory, sized to this game's grid
+            self._step = _kernels.ProcessStep()
+        else:
+            self._step = _kernels.KERNELS.get(backend, _kernels.step)
+        
+        # Second cell buffer; each step writes into it and then swaps it in
+        self._back = np.zeros_like(self.grid._cells)
     
     def next_generation(self) -> None:
         """
@@ -37,25 +71,61 @@ class GameOfLife:
         
         Creates a new grid state based on current state and Conway's rules.
         Updates the current grid and increments generation counter.
+        
+        The step kernel selected by the backend (by default the compiled C
+        or Numba kernel when available, else tiled NumPy) writes into a
+        preallocated back buffer, which is then swapped with the grid's
+        cells, so no array is allocated per generation.
         """
-        # Create new grid for next generation
-        new_grid = Grid(self.width, self.height)
-        
-        # Apply Conway's rules to each cell
-        for y in range(self.height):
-            for x in range(self.width):
-                neighbors = self.grid.count_neighbors(x, y)
-                currently_alive = self.grid.get_cell(x, y)
-                
-                # Apply Conway's 4 rules
-                new_state = self._apply_conway_rules(currently_alive, neighbors)
-                new_grid.set_cell(x, y, new_state)
-        
-        # Update to new generation
-        self.grid = new_grid
+        front = self.grid._cells
+        if self._back.shape != front.shape:
+            self._back = np.zeros_like(front)
+        
+        self._step(front, self._back)
+        
+        # Swap buffers: the old front becomes the next back buffer
+        self.grid._cells, self._back = self._back, front
+        self.grid._population = None
         self.generation += 1
     
-    def _apply_conway_rules(self, is_alive: bool, neighbor_count: int) -> bool:
+    def advance(self, generations: int) -> None:
+        """
+        Evolve the grid by several generations at once.
+        
+        With backend='hashlife' and power-of-two grid sides, the
+        generations are computed with HashLife, which can jump millions of
+        generations for periodic or sparse patterns. Otherwise this is the
+        same as calling next_generation repeatedly.
+        
+        With backend='cupy' the grid is copied to the GPU once, all
+        generations run there, and the result is copied back.
+        
+        Args:
+            generations: Number of generations to advance
+        
+        Raises:
+            ValueError: If generations is negative
+        """
+        if generations < 0:
+            raise ValueError("Generations must be non-negative")
+        
+        if self.backend == 'hashlife' and hashlife.supports(self.grid.width, self.grid.height):
+            self.grid._cells[:] = hashlife.advance_torus(self.grid._cells, generations)
+            self.grid._population = None
+            self.generation += generations
+            return
+        
+        if self.backend == 'cupy':
+            self.grid._cells[:] = _kernels.advance_cupy(self.grid._cells, generations)
+            self.grid._population = None
+            self.generation += generations
+            return
+        
+        for _ in range(generations):
+            self.next_generation()
+    
+    @staticmethod
+    def _apply_conway_rules(is_alive: bool, neighbor_count: int) -> bool:
         """
         Apply Conway's 4 rules to determine new cell state.
         
@@ -66,20 +136,14 @@ class GameOfLife:
         Returns:
             True if cell should be alive in next generation, False otherwise
         """
-        if is_alive:
-            # Living cell rules
-            if neighbor_count < 2:
-                return False  # Death by loneliness
-            elif neighbor_count in [2, 3]:
-                return True   # Survival
-            else:  # neighbor_count > 3
-                return False  # Death by overcrowding
-        else:
-            # Dead cell rules
-            if neighbor_count == 3:
-                return True   # Birth
-            else:
-                return False  # Stay dead
+        # Living cell: survives with 2-3 neighbors, dies of loneliness (<2)
+        # or overcrowding (>3). Dead cell: born with exactly 3 neighbors.
+        return bool(_RULE_LUT[(int(is_alive) << 4) | neighbor_count])
+    
+    def close(self) -> None:
+        """Release backend resources (the worker pool of backend='processes')."""
+        if isinstance(self._step, _kernels.ProcessStep):
+            self._step.close()
     
     def reset(self) -> None:
         """Reset the simulation to generation 0 with empty grid."""
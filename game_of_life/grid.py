@@ -3,8 +3,11 @@ Conway's Game of Life - Grid Module
 Manages the 2D grid data structure for the cellular automaton.
 """
 
-import random
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from . import _kernels
 
 
 class Grid:
@@ -12,9 +15,15 @@ class Grid:
     Represents a 2D grid for Conway's Game of Life.
     
     Each cell can be alive (True) or dead (False).
-    The grid uses a 2D list where grid[y][x] accesses the cell at position (x, y).
+    Cells are stored in a NumPy uint8 array of shape (height, width), where
+    _cells[y, x] is the cell at (x, y) (1 = alive, 0 = dead), so whole-grid
+    operations run as vectorized array code.
     """
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = ('width', 'height', '_cells', '_population',
+                 '_xm1', '_xp1', '_ym1', '_yp1')
+    
     def __init__(self, width: int, height: int):
         """
         Initialize a grid with all cells dead.
@@ -28,7 +37,27 @@ class Grid:
         
         self.width = width
         self.height = height
-        self.cells = [[False for _ in range(width)] for _ in range(height)]
+        self._cells = np.zeros((height, width), dtype=np.uint8)
+        
+        # Cached number of living cells: kept up to date by set_cell, None
+        # after bulk changes to _cells (recounted on the next query)
+        self._population: Optional[int] = 0
+        
+        # Wrapped previous/next index for every column and row, so
+        # count_neighbors needs no modulo
+        self._xm1 = [(x - 1) % width for x in range(width)]
+        self._xp1 = [(x + 1) % width for x in range(width)]
+        self._ym1 = [(y - 1) % height for y in range(height)]
+        self._yp1 = [(y + 1) % height for y in range(height)]
+    
+    @property
+    def cells(self) -> List[List[bool]]:
+        """
+        Unpacked copy of the grid as a 2D list where cells[y][x] is the cell at (x, y).
+        
+        Read-only view for inspection; use set_cell to change cells.
+        """
+        return self._cells.astype(bool).tolist()
     
     def set_cell(self, x: int, y: int, alive: bool) -> None:
         """
@@ -45,7 +74,34 @@ class Grid:
         if not (0 <= x < self.width and 0 <= y < self.height):
             raise IndexError(f"Cell ({x}, {y}) is out of bounds for grid {self.width}x{self.height}")
         
-        self.cells[y][x] = alive
+        new = 1 if alive else 0
+        if self._population is not None:
+            # Adjust the cached count by the change instead of dropping it
+            self._population += new - self._cells.item(y, x)
+        self._cells[y, x] = new
+    
+    def set_cells(self, cells: Iterable[Tuple[int, int]], alive: bool = True) -> None:
+        """
+        Set the state of many cells with one array assignment.
+        
+        Args:
+            cells: (x, y) coordinates of the cells to set
+            alive: True for alive, False for dead
+        
+        Raises:
+            IndexError: If any coordinate is out of bounds (no cell is changed)
+        """
+        coords = np.array(list(cells), dtype=np.intp).reshape(-1, 2)
+        xs = coords[:, 0]
+        ys = coords[:, 1]
+        
+        outside = (xs < 0) | (xs >= self.width) | (ys < 0) | (ys >= self.height)
+        if outside.any():
+            x, y = coords[np.argmax(outside)].tolist()
+            raise IndexError(f"Cell ({x}, {y}) is out of bounds for grid {self.width}x{self.height}")
+        
+        self._cells[ys, xs] = 1 if alive else 0
+        self._population = None
     
     def get_cell(self, x: int, y: int) -> bool:
         """
@@ -64,7 +120,8 @@ class Grid:
         if not (0 <= x < self.width and 0 <= y < self.height):
             raise IndexError(f"Cell ({x}, {y}) is out of bounds for grid {self.width}x{self.height}")
         
-        return self.cells[y][x]
+        # item() returns a Python int, skipping the NumPy scalar that [y, x] builds
+        return self._cells.item(y, x) == 1
     
     def count_neighbors(self, x: int, y: int) -> int:
         """
@@ -79,39 +136,56 @@ class Grid:
         Returns:
             Number of living neighbors (0-8)
         """
-        count = 0
+        # Coordinates outside the grid wrap too
+        x %= self.width
+        y %= self.height
         
-        # Check all 8 surrounding cells
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                # Skip the cell itself
-                if dx == 0 and dy == 0:
-                    continue
-                
-                # Wrap around edges (toroidal grid)
-                nx = (x + dx) % self.width
-                ny = (y + dy) % self.height
-                
-                if self.cells[ny][nx]:
-                    count += 1
+        if _kernels.count_neighbors is not None:
+            return _kernels.count_neighbors(self._cells, x, y)
+        
+        left = self._xm1[x]
+        right = self._xp1[x]
+        up = self._ym1[y]
+        down = self._yp1[y]
+        item = self._cells.item
         
-        return count
+        # Sum the 8 surrounding cells (wrapped indices from the lookup tables)
+        return (item(up, left) + item(up, x) + item(up, right) +
+                item(y, left) + item(y, right) +
+                item(down, left) + item(down, x) + item(down, right))
+    
+    def neighbor_counts(self) -> np.ndarray:
+        """
+        Count living neighbors for every cell at once (toroidal, like count_neighbors).
+        
+        Returns:
+            uint8 array of shape (height, width) with neighbor counts (0-8)
+        """
+        return _kernels.neighbor_counts(self._cells)
     
     def get_living_cells(self) -> int:
         """
         Count total number of living cells in the grid.
         
+        The count is cached and adjusted by set_cell, and only recounted
+        after bulk changes (set_cells, randomize, a new generation), so
+        repeated calls (e.g. from the visualizers) are O(1).
+        
         Returns:
             Number of alive cells
         """
-        count = 0
-        for row in self.cells:
-            count += sum(1 for cell in row if cell)
-        return count
+        if self._population is None:
+            self._population = int(np.count_nonzero(self._cells))
+        return self._population
+    
+    def population(self) -> int:
+        """Number of living cells (same cached count as get_living_cells)."""
+        return self.get_living_cells()
     
     def clear(self) -> None:
         """Reset all cells to dead state."""
-        self.cells = [[False for _ in range(self.width)] for _ in range(self.height)]
+        self._cells.fill(0)
+        self._population = 0
     
     def randomize(self, density: float = 0.3) -> None:
         """
@@ -126,9 +200,10 @@ class Grid:
         if not (0.0 <= density <= 1.0):
             raise ValueError("Density must be between 0.0 and 1.0")
         
-        for y in range(self.height):
-            for x in range(self.width):
-                self.cells[y][x] = random.random() < density
+        # Write into the existing array so it is not reallocated
+        np.less(np.random.random((self.height, self.width)), density,
+                out=self._cells, casting='unsafe')
+        self._population = None
     
     def set_pattern(self, pattern: List[List[int]], offset_x: int = 0, offset_y: int = 0) -> None:
         """
@@ -154,7 +229,8 @@ class Grid:
                 
                 # Only set if within bounds
                 if 0 <= x < self.width and 0 <= y < self.height:
-                    self.cells[y][x] = bool(cell)
+                    self._cells[y, x] = 1 if cell else 0
+        self._population = None
     
     def copy(self) -> 'Grid':
         """
@@ -164,7 +240,8 @@ class Grid:
             New Grid instance with same state
         """
         new_grid = Grid(self.width, self.height)
-        new_grid.cells = [row[:] for row in self.cells]
+        new_grid._cells = self._cells.copy()
+        new_grid._population = self._population
         return new_grid
     
     def __str__(self) -> str:
@@ -175,7 +252,7 @@ class Grid:
             Multi-line string showing grid state (● for alive, ○ for dead)
         """
         lines = []
-        for row in self.cells:
+        for row in self._cells.tolist():
             line = ''.join('●' if cell else '○' for cell in row)
             lines.append(line)
         return '\n'.join(lines)
@@ -188,6 +265,6 @@ class Grid:
         """
         if not isinstance(other, Grid):
             return False
-        return (self.width == other.width and 
-                self.height == other.height and 
-                self.cells == other.cells)
+        return (self.width == other.width and
+                self.height == other.height and
+                np.array_equal(self._cells, other._cells))
@@ -0,0 +1,277 @@
+"""
+HashLife for Conway's Game of Life.
+
+Represents the grid as a quadtree of canonical (hash-consed) nodes and
+memoizes the future of every node, so identical regions and repeated
+states are only ever evolved once. Jumping 2^j generations costs about
+the same as a single generation once the memo is warm, which makes
+far-future queries (millions of generations) cheap for periodic or
+mostly empty patterns.
+
+The grid in GameOfLife is a torus. A torus is the same as the infinite
+plane tiled with copies of itself, so a square torus whose side is a
+power of two maps exactly onto quadtree nodes; rectangular grids with
+power-of-two sides are first tiled into a square. Other sizes are not
+supported (see supports()).
+
+HashLife pays off on periodic, sparse or otherwise repetitive patterns;
+on chaotic "soup" it is slower than the array kernels, so GameOfLife only
+uses it when asked to (backend='hashlife').
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .leaf_table import LEAF_TABLE
+
+
+class Node:
+    """
+    Quadtree node covering a 2^level x 2^level square.
+
+    Nodes are canonical: there is exactly one Node for every distinct
+    content (see join), so nodes compare and hash by identity.
+    """
+
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population', 'futures')
+
+    def __init__(self, level: int, nw: Optional['Node'], ne: Optional['Node'],
+                 sw: Optional['Node'], se: Optional['Node'], population: int):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+        # Memoized successor() results, keyed by j (2^j generations)
+        self.futures: Dict[int, 'Node'] = {}
+
+    def __repr__(self) -> str:
+        return f"Node(level={self.level}, population={self.population})"
+
+
+# Single cells (level 0)
+DEAD = Node(0, None, None, None, None, 0)
+ALIVE = Node(0, None, None, None, None, 1)
+
+# Canonical node for each (nw, ne, sw, se) tuple
+_nodes: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+
+# advance_torus starts from an empty cache once it holds this many nodes
+MAX_NODES = 4_000_000
+
+
+def join(nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+    """Return the canonical node with the given four quadrants (all one level lower)."""
+    key = (nw, ne, sw, se)
+    node = _nodes.get(key)
+    if node is None:
+        node = Node(nw.level + 1, nw, ne, sw, se,
+                    nw.population + ne.population + sw.population + se.population)
+        _nodes[key] = node
+    return node
+
+
+def clear_cache() -> None:
+    """Drop all canonical nodes and memoized futures (frees memory)."""
+    _nodes.clear()
+
+
+def centre(node: Node) -> Node:
+    """The centred quadrant-sized node (one level lower) of node."""
+    return join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+
+def _leaf_bits(node: Node) -> int:
+    """Pack a level-2 node into 16 bits (bit 4*row + col)."""
+    rows = ((node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne),
+            (node.nw.sw, node.nw.se, node.ne.sw, node.ne.se),
+            (node.sw.nw, node.sw.ne, node.se.nw, node.se.ne),
+            (node.sw.sw, node.sw.se, node.se.sw, node.se.se))
+    bits = 0
+    for row, cells in enumerate(rows):
+        for col, cell in enumerate(cells):
+            bits |= cell.population << (4 * row + col)
+    return bits
+
+
+def _life_4x4(node: Node) -> Node:
+    """Centre 2x2 of a level-2 node after one generation (one LEAF_TABLE lookup)."""
+    packed = LEAF_TABLE[_leaf_bits(node)]
+    nw, ne, sw, se = ((ALIVE if packed >> bit & 1 else DEAD) for bit in range(4))
+    return join(nw, ne, sw, se)
+
+
+def successor(node: Node, j: Optional[int] = None) -> Node:
+    """
+    Centre of node (one level lower) after 2^j generations.
+
+    Args:
+        node: Node of level 2 or higher
+        j: log2 of the number of generations, at most node.level - 2
+           (the default)
+
+    Returns:
+        Canonical node of level node.level - 1
+    """
+    if j is None or j > node.level - 2:
+        j = node.level - 2
+
+    future = node.futures.get(j)
+    if future is not None:
+        return future
+
+    if node.population == 0:
+        future = node.nw
+    elif node.level == 2:
+        future = _life_4x4(node)
+    else:
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        # The nine overlapping sub-squares one level down, advanced 2^j
+        # (or half of that, when j is the full step for this level)
+        c1 = successor(nw, j)
+        c2 = successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+        c3 = successor(ne, j)
+        c4 = successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+        c5 = successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+        c6 = successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+        c7 = successor(sw, j)
+        c8 = successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+        c9 = successor(se, j)
+
+        if j < node.level - 2:
+            # Already advanced far enough: just reassemble the centre
+            future = join(join(c1.se, c2.sw, c4.ne, c5.nw),
+                          join(c2.se, c3.sw, c5.ne, c6.nw),
+                          join(c4.se, c5.sw, c7.ne, c8.nw),
+                          join(c5.se, c6.sw, c8.ne, c9.nw))
+        else:
+            # Second half-step on the four overlapping intermediate squares
+            future = join(successor(join(c1, c2, c4, c5), j),
+                          successor(join(c2, c3, c5, c6), j),
+                          successor(join(c4, c5, c7, c8), j),
+                          successor(join(c5, c6, c8, c9), j))
+
+    node.futures[j] = future
+    return future
+
+
+def from_array(cells: np.ndarray) -> Node:
+    """
+    Build the canonical node for a square array whose side is a power of two.
+
+    Args:
+        cells: (2^k, 2^k) array, nonzero = alive
+    """
+    size = cells.shape[0]
+    if size == 1:
+        return ALIVE if cells[0, 0] else DEAD
+    if not cells.any():
+        return _empty(size.bit_length() - 1)
+    half = size // 2
+    return join(from_array(cells[:half, :half]), from_array(cells[:half, half:]),
+                from_array(cells[half:, :half]), from_array(cells[half:, half:]))
+
+
+def _empty(level: int) -> Node:
+    """Canonical all-dead node of the given level."""
+    node = DEAD
+    for _ in range(level):
+        node = join(node, node, node, node)
+    return node
+
+
+def to_array(node: Node, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Write a node's cells into a uint8 array (allocated if out is None).
+
+    Returns:
+        (2^level, 2^level) uint8 array, 1 = alive
+    """
+    size = 1 << node.level
+    if out is None:
+        out = np.zeros((size, size), dtype=np.uint8)
+    if node.population == 0:
+        out[:] = 0
+    elif node.level == 0:
+        out[0, 0] = 1
+    else:
+        half = size // 2
+        to_array(node.nw, out[:half, :half])
+        to_array(node.ne, out[:half, half:])
+        to_array(node.sw, out[half:, :half])
+        to_array(node.se, out[half:, half:])
+    return out
+
+
+def supports(width: int, height: int) -> bool:
+    """True if a width x height torus can be advanced with HashLife (power-of-two sides, >= 2)."""
+    def power_of_two(n: int) -> bool:
+        return n >= 2 and n & (n - 1) == 0
+
+    return power_of_two(width) and power_of_two(height)
+
+
+def _torus_step(torus: Node, j: int) -> Node:
+    """Advance a torus node 2^j generations (j <= torus.level - 1)."""
+    # The tiled plane around the torus, evolved, has the evolved torus at
+    # its centre but shifted by half a side; tiling again and taking the
+    # centre shifts it back.
+    shifted = successor(join(torus, torus, torus, torus), j)
+    return centre(join(shifted, shifted, shifted, shifted))
+
+
+def advance_torus(cells: np.ndarray, generations: int) -> np.ndarray:
+    """
+    Cells of a toroidal grid after the given number of generations.
+
+    Steps in the largest power-of-two jumps the torus allows. Since the
+    states of a finite torus are canonical nodes, a repeated state is
+    detected and whole cycles are skipped, so the cost does not grow with
+    generations once the pattern becomes periodic.
+
+    Args:
+        cells: (height, width) array, nonzero = alive; both sides powers of two
+        generations: Number of generations to advance (>= 0)
+
+    Returns:
+        New (height, width) uint8 array
+
+    Raises:
+        ValueError: If the grid size is not supported or generations < 0
+    """
+    height, width = cells.shape
+    if not supports(width, height):
+        raise ValueError(f"HashLife needs power-of-two grid sides, got {width}x{height}")
+    if generations < 0:
+        raise ValueError("Generations must be non-negative")
+    if len(_nodes) > MAX_NODES:
+        clear_cache()
+
+    # A rectangle tiled into a square is still the same periodic plane
+    side = max(width, height)
+    square = np.tile(cells, (side // height, side // width))
+    torus = from_array(square)
+
+    max_j = torus.level - 1
+    big_step = 1 << max_j
+    remaining = generations
+    seen: Dict[Node, int] = {}
+    while remaining >= big_step:
+        if torus in seen:
+            # Cycle found: skip as many whole periods as still fit
+            period = seen[torus] - remaining
+            remaining %= period
+            seen.clear()
+            if remaining < big_step:
+                break
+        seen[torus] = remaining
+        torus = _torus_step(torus, max_j)
+        remaining -= big_step
+
+    for j in range(max_j - 1, -1, -1):
+        if remaining & (1 << j):
+            torus = _torus_step(torus, j)
+
+    return to_array(torus)[:height, :width]
@@ -0,0 +1,47 @@
+"""
+Lookup tables for evaluating small Game of Life blocks.
+
+NEXT_STATE maps a 3x3 neighborhood (9 bits, bit 3*row + col) to the next
+state of its centre cell. LEAF_TABLE maps a whole 4x4 block (16 bits,
+bit 4*row + col) to the next states of its centre 2x2 cells, packed as
+4 bits (bit 0 = top-left, 1 = top-right, 2 = bottom-left,
+3 = bottom-right), so one lookup replaces four neighbor counts and rule
+checks.
+"""
+
+import numpy as np
+
+
+def _next_state(code: int) -> int:
+    """Next state of the centre cell of a packed 3x3 neighborhood."""
+    count = bin(code & ~0b000010000).count('1')
+    return 1 if count == 3 or (count == 2 and code & 0b000010000) else 0
+
+
+# Next centre state for all 512 3x3 neighborhoods
+NEXT_STATE = bytes(_next_state(code) for code in range(512))
+
+# Centre cells of a 4x4 block as (row, col), in output bit order
+LEAF_CENTRE = ((1, 1), (1, 2), (2, 1), (2, 2))
+
+
+def neighborhood(block: int, row: int, col: int) -> int:
+    """The 9-bit neighborhood of (row, col) in a 16-bit 4x4 block (works on arrays too)."""
+    shift = 4 * (row - 1) + col - 1
+    return ((block >> shift) & 0b111
+            | ((block >> (shift + 4)) & 0b111) << 3
+            | ((block >> (shift + 8)) & 0b111) << 6)
+
+
+def _build_leaf_table() -> bytes:
+    """Evaluate all 65536 4x4 blocks at once with NumPy."""
+    blocks = np.arange(1 << 16, dtype=np.uint32)
+    next_state = np.frombuffer(NEXT_STATE, dtype=np.uint8)
+    table = np.zeros(1 << 16, dtype=np.uint8)
+    for bit, (row, col) in enumerate(LEAF_CENTRE):
+        table |= next_state[neighborhood(blocks, row, col)] << bit
+    return table.tobytes()
+
+
+# Next centre 2x2 (4 bits) for all 65536 4x4 blocks (64 KiB)
+LEAF_TABLE = _build_leaf_table()
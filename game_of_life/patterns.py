@@ -8,6 +8,31 @@ from .grid import Grid
 from .game_engine import GameOfLife
 
 
+# Alive cells of each pattern as (dx, dy) offsets from the position passed
+# to the matching create_* method
+BLINKER = ((-1, 0), (0, 0), (1, 0))
+BLOCK = ((0, 0), (1, 0), (0, 1), (1, 1))
+BEEHIVE = ((0, -1), (1, -1),
+           (-1, 0), (2, 0),
+           (0, 1), (1, 1))
+TOAD = ((0, -1), (1, -1), (2, -1),
+        (-1, 0), (0, 0), (1, 0))
+BEACON = ((0, 0), (1, 0), (0, 1),
+          (2, 2), (3, 2), (3, 3))
+GLIDER = ((1, 0),
+          (2, 1),
+          (0, 2), (1, 2), (2, 2))
+LOAF = ((0, -1), (1, -1),
+        (-1, 0), (2, 0),
+        (0, 1), (2, 1),
+        (1, 2))
+
+
+def _place(game: GameOfLife, offsets: Tuple[Tuple[int, int], ...], x: int, y: int) -> None:
+    """Set the cells of a pattern alive, with offsets relative to (x, y)."""
+    game.grid.set_cells([(x + dx, y + dy) for dx, dy in offsets], True)
+
+
 class PatternLibrary:
     """
     Library of famous Conway's Game of Life patterns.
@@ -30,9 +55,7 @@ class PatternLibrary:
             game: GameOfLife instance to modify
             center_x, center_y: Center position for the pattern
         """
-        game.grid.set_cell(center_x - 1, center_y, True)
-        game.grid.set_cell(center_x, center_y, True)
-        game.grid.set_cell(center_x + 1, center_y, True)
+        _place(game, BLINKER, center_x, center_y)
     
     @staticmethod
     def create_block(game: GameOfLife, top_left_x: int, top_left_y: int) -> None:
@@ -46,10 +69,7 @@ class PatternLibrary:
             game: GameOfLife instance to modify
             top_left_x, top_left_y: Top-left corner position
         """
-        game.grid.set_cell(top_left_x, top_left_y, True)
-        game.grid.set_cell(top_left_x + 1, top_left_y, True)
-        game.grid.set_cell(top_left_x, top_left_y + 1, True)
-        game.grid.set_cell(top_left_x + 1, top_left_y + 1, True)
+        _place(game, BLOCK, top_left_x, top_left_y)
     
     @staticmethod
     def create_beehive(game: GameOfLife, center_x: int, center_y: int) -> None:
@@ -63,17 +83,7 @@ class PatternLibrary:
             game: GameOfLife instance to modify
             center_x, center_y: Center position for the pattern
         """
-        # Top row
-        game.grid.set_cell(center_x, center_y - 1, True)
-        game.grid.set_cell(center_x + 1, center_y - 1, True)
-        
-        # Middle rows
-        game.grid.set_cell(center_x - 1, center_y, True)
-        game.grid.set_cell(center_x + 2, center_y, True)
-        
-        # Bottom row  
-        game.grid.set_cell(center_x, center_y + 1, True)
-        game.grid.set_cell(center_x + 1, center_y + 1, True)
+        _place(game, BEEHIVE, center_x, center_y)
     
     @staticmethod
     def create_toad(game: GameOfLife, center_x: int, center_y: int) -> None:
@@ -87,15 +97,7 @@ class PatternLibrary:
             game: GameOfLife instance to modify
             center_x, center_y: Center position for the pattern
         """
-        # Top row (offset right)
-        game.grid.set_cell(center_x, center_y - 1, True)
-        game.grid.set_cell(center_x + 1, center_y - 1, True)
-        game.grid.set_cell(center_x + 2, center_y - 1, True)
-        
-        # Bottom row (offset left)
-        game.grid.set_cell(center_x - 1, center_y, True)
-        game.grid.set_cell(center_x, center_y, True)
-        game.grid.set_cell(center_x + 1, center_y, True)
+        _place(game, TOAD, center_x, center_y)
     
     @staticmethod
     def create_beacon(game: GameOfLife, top_left_x: int, top_left_y: int) -> None:
@@ -109,15 +111,7 @@ class PatternLibrary:
             game: GameOfLife instance to modify
             top_left_x, top_left_y: Top-left corner position
         """
-        # Top-left block
-        game.grid.set_cell(top_left_x, top_left_y, True)
-        game.grid.set_cell(top_left_x + 1, top_left_y, True)
-        game.grid.set_cell(top_left_x, top_left_y + 1, True)
-        
-        # Bottom-right block
-        game.grid.set_cell(top_left_x + 2, top_left_y + 2, True)
-        game.grid.set_cell(top_left_x + 3, top_left_y + 2, True)
-        game.grid.set_cell(top_left_x + 3, top_left_y + 3, True)
+        _place(game, BEACON, top_left_x, top_left_y)
     
     @staticmethod
     def create_glider(game: GameOfLife, top_left_x: int, top_left_y: int) -> None:
@@ -136,11 +130,7 @@ class PatternLibrary:
         #  ○○●  
         #  ●●●
         
-        game.grid.set_cell(top_left_x + 1, top_left_y, True)      # Top middle
-        game.grid.set_cell(top_left_x + 2, top_left_y + 1, True)  # Right middle
-        game.grid.set_cell(top_left_x, top_left_y + 2, True)      # Bottom left
-        game.grid.set_cell(top_left_x + 1, top_left_y + 2, True)  # Bottom middle
-        game.grid.set_cell(top_left_x + 2, top_left_y + 2, True)  # Bottom right
+        _place(game, GLIDER, top_left_x, top_left_y)
     
     @staticmethod
     def create_loaf(game: GameOfLife, center_x: int, center_y: int) -> None:
@@ -160,20 +150,7 @@ class PatternLibrary:
         #  ○●○●
         #  ○○●○
         
-        # Top row
-        game.grid.set_cell(center_x, center_y - 1, True)
-        game.grid.set_cell(center_x + 1, center_y - 1, True)
-        
-        # Second row
-        game.grid.set_cell(center_x - 1, center_y, True)
-        game.grid.set_cell(center_x + 2, center_y, True)
-        
-        # Third row
-        game.grid.set_cell(center_x, center_y + 1, True)
-        game.grid.set_cell(center_x + 2, center_y + 1, True)
-        
-        # Bottom row
-        game.grid.set_cell(center_x + 1, center_y + 2, True)
+        _place(game, LOAF, center_x, center_y)
     
     @classmethod
     def get_pattern_info(cls) -> Dict[str, Dict[str, Any]]:
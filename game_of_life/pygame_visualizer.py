@@ -68,6 +68,9 @@ class PygameVisualizer:
         # Font for UI text
         self.font = pygame.font.Font(None, 24)
         
+        # Grid line paths are fixed for a given size, so build them once
+        self._grid_paths = self._build_grid_paths()
+    
     def run(self) -> None:
         """Main game loop with interactive controls."""
         print("🎮 Conway's Game of Life - Pygame Interactive")
@@ -156,19 +159,42 @@ class PygameVisualizer:
         
         pygame.display.flip()
     
-    def _draw_grid(self) -> None:
-        """Draw grid lines."""
-        # Vertical lines
+    def _build_grid_paths(self) -> Tuple[list, list]:
+        """
+        Build serpentine polylines covering every grid line.
+        
+        Consecutive lines are joined along the outer border (which is a grid
+        line anyway), so each direction can be drawn with one draw call.
+        
+        Returns:
+            Tuple of (vertical_path, horizontal_path) point lists
+        """
+        grid_px_width = self.grid_width * self.tile_size
+        grid_px_height = self.grid_height * self.tile_size
+        
+        vertical_path = []
         for x in range(self.grid_width + 1):
-            start_pos = (x * self.tile_size, 0)
-            end_pos = (x * self.tile_size, self.grid_height * self.tile_size)
-            pygame.draw.line(self.screen, self.GREY, start_pos, end_pos, 1)
+            px = x * self.tile_size
+            if x % 2 == 0:
+                vertical_path.extend([(px, 0), (px, grid_px_height)])
+            else:
+                vertical_path.extend([(px, grid_px_height), (px, 0)])
         
-        # Horizontal lines
+        horizontal_path = []
         for y in range(self.grid_height + 1):
-            start_pos = (0, y * self.tile_size)
-            end_pos = (self.grid_width * self.tile_size, y * self.tile_size)
-            pygame.draw.line(self.screen, self.GREY, start_pos, end_pos, 1)
+            py = y * self.tile_size
+            if y % 2 == 0:
+                horizontal_path.extend([(0, py), (grid_px_width, py)])
+            else:
+                horizontal_path.extend([(grid_px_width, py), (0, py)])
+        
+        return vertical_path, horizontal_path
+    
+    def _draw_grid(self) -> None:
+        """Draw grid lines (one batched draw call per direction)."""
+        vertical_path, horizontal_path = self._grid_paths
+        pygame.draw.lines(self.screen, self.GREY, False, vertical_path, 1)
+        pygame.draw.lines(self.screen, self.GREY, False, horizontal_path, 1)
     
     def _draw_cells(self) -> None:
         """Draw alive cells as colored rectangles."""
@@ -212,12 +238,7 @@ class PygameVisualizer:
     
     def _count_alive_cells(self) -> int:
         """Count total alive cells in grid."""
-        count = 0
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                if self.game.grid.get_cell(x, y):
-                    count += 1
-        return count
+        return self.game.get_living_cells()
     
     def _clear_grid(self) -> None:
         """Clear all cells and reset generation counter."""
@@ -4,7 +4,11 @@ Provides visual display of grid state with generation counter and statistics.
 """
 
 import os
-from typing import Optional
+import sys
+from typing import Optional, Tuple
+
+import numpy as np
+
 from .grid import Grid
 
 
@@ -17,14 +21,28 @@ class Visualizer:
     - ○ (empty circle) for dead cells
     
     Includes generation counter and population statistics.
+    
+    Other symbols can be passed as glyphs; Visualizer.compact() uses the
+    single-byte '.' and '#', which cuts the bytes written per animation
+    frame to about a third.
     """
     
     ALIVE_SYMBOL = "●"
     DEAD_SYMBOL = "○"
     
-    def __init__(self):
-        """Initialize the visualizer."""
-        pass
+    def __init__(self, glyphs: Tuple[str, str] = (DEAD_SYMBOL, ALIVE_SYMBOL)):
+        """
+        Initialize the visualizer.
+        
+        Args:
+            glyphs: (dead, alive) symbols used for cells
+        """
+        self.glyphs = tuple(glyphs)
+    
+    @classmethod
+    def compact(cls) -> 'Visualizer':
+        """Visualizer using single-byte symbols ('.' dead, '#' alive)."""
+        return cls(glyphs=(".", "#"))
     
     def display_grid(self, grid: Grid, generation: int = 0) -> str:
         """
@@ -33,33 +51,23 @@ class Visualizer:
         Args:
             grid: The Grid instance to display
             generation: Current generation number
-            
+        
         Returns:
             String containing the formatted grid display
         """
-        lines = []
+        separator = "=" * (grid.width * 2)
         
-        # Header with generation info
-        lines.append(f"Generation: {generation}")
-        lines.append("=" * (grid.width * 2))
+        # Grid display: look up every cell's symbol at once (index 0 = dead,
+        # 1 = alive), then join each row once
+        glyphs = np.array(self.glyphs)
+        rows = [" ".join(row) for row in glyphs[grid._cells].tolist()]
         
-        # Grid display
-        for y in range(grid.height):
-            row = ""
-            for x in range(grid.width):
-                if grid.get_cell(x, y):
-                    row += self.ALIVE_SYMBOL + " "
-                else:
-                    row += self.DEAD_SYMBOL + " "
-            lines.append(row.rstrip())  # Remove trailing space
-        
-        # Statistics
-        lines.append("=" * (grid.width * 2))
+        # Header with generation info, grid, statistics
         alive_count = self._count_alive_cells(grid)
         total_cells = grid.width * grid.height
-        lines.append(f"Population: {alive_count} / {total_cells}")
-        
-        return "\n".join(lines)
+        return "\n".join([f"Generation: {generation}", separator,
+                          *rows,
+                          separator, f"Population: {alive_count} / {total_cells}"])
     
     def clear_screen(self) -> None:
         """Clear the terminal screen for animation effect."""
@@ -77,7 +85,9 @@ class Visualizer:
         if clear:
             self.clear_screen()
         
-        print(self.display_grid(grid, generation))
+        # One write and one flush per frame
+        sys.stdout.write(self.display_grid(grid, generation) + "\n")
+        sys.stdout.flush()
     
     def _count_alive_cells(self, grid: Grid) -> int:
         """
@@ -85,13 +95,8 @@ class Visualizer:
         
         Args:
             grid: The Grid instance to count
-            
+        
         Returns:
             Number of alive cells
         """
-        count = 0
-        for y in range(grid.height):
-            for x in range(grid.width):
-                if grid.get_cell(x, y):
-                    count += 1
-        return count
\ No newline at end of file
+        return grid.get_living_cells()
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Build script for the optional compiled kernels.
+
+    python setup.py build_ext --inplace
+
+The Python packages work without this step; compiled modules are picked
+up automatically when present. The extensions are optional: if Cython or
+a C compiler is missing, or a module fails to build, installation still
+succeeds with the pure-Python kernels. OpenMP is used only when the
+compiler supports it.
+"""
+
+import os
+import tempfile
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+try:
+    import numpy as np
+    from Cython.Build import cythonize
+except ImportError:  # Build tools missing: install without the compiled kernels
+    cythonize = None
+
+OPENMP_TEST = "#include <omp.h>\nint main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }\n"
+
+
+def _openmp_flags(compiler):
+    """(compile_args, link_args) enabling OpenMP, or empty lists if unsupported."""
+    if compiler.compiler_type == 'msvc':
+        return ['/openmp'], []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'openmp_test.c')
+        with open(source, 'w') as f:
+            f.write(OPENMP_TEST)
+        try:
+            objects = compiler.compile([source], output_dir=tmp, extra_postargs=['-fopenmp'])
+            compiler.link_executable(objects, os.path.join(tmp, 'openmp_test'),
+                                     extra_postargs=['-fopenmp'])
+        except Exception:  # CompileError, LinkError
+            return [], []
+    return ['-fopenmp'], ['-fopenmp']
+
+
+class BuildExt(build_ext):
+    """build_ext that picks optimization and OpenMP flags for the compiler in use."""
+
+    def build_extensions(self):
+        optimize = ['/O2'] if self.compiler.compiler_type == 'msvc' else ['-O3']
+        openmp_compile, openmp_link = _openmp_flags(self.compiler)
+        for ext in self.extensions:
+            ext.extra_compile_args = optimize + openmp_compile
+            ext.extra_link_args = openmp_link
+        super().build_extensions()
+
+
+if cythonize is None:
+    extensions = []
+else:
+    extensions = cythonize([
+        Extension(
+            'courier_optimizer._courier_c',
+            ['courier_optimizer/_courier_c.pyx'],
+            include_dirs=[np.get_include()],
+        ),
+        Extension(
+            'game_of_life._step_c',
+            ['game_of_life/_step_c.pyx'],
+        ),
+    ], compiler_directives={'language_level': 3})
+    # Set after cythonize, which does not carry the flag over; a module
+    # that fails to compile is then skipped instead of failing the build
+    for ext in extensions:
+        ext.optional = True
+
+setup(ext_modules=extensions, cmdclass={'build_ext': BuildExt})
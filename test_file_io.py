@@ -4,8 +4,9 @@ Test script for File I/O functionality.
 Demonstrates reading deliveries, processing, and writing output files.
 """
 
+from pathlib import Path
+
 from courier_optimizer.courier_optimizer import CourierOptimizer
-import os
 
 def test_file_io():
     """Test complete File I/O workflow."""
@@ -16,13 +17,11 @@ def test_file_io():
     optimizer = CourierOptimizer()
     
     # Define file paths
-    input_file = 'data/deliveries.csv'
-    output_dir = 'output'
-    route_file = os.path.join(output_dir, 'route.csv')
-    rejected_file = os.path.join(output_dir, 'rejected.csv')
-    
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    # (the writers create the output directory if it doesn't exist)
+    input_file = Path('data') / 'deliveries.csv'
+    output_dir = Path('output')
+    route_file = output_dir / 'route.csv'
+    rejected_file = output_dir / 'rejected.csv'
     
     print("📁 Step 1: Reading deliveries from CSV...")
     print(f"   Input file: {input_file}\n")
@@ -2,10 +2,15 @@
 Test suite for CourierOptimizer core functionality.
 """
 
+from pathlib import Path
+
+import numpy as np
 import pytest
 import pandas as pd
 
 from courier_optimizer.courier_optimizer import CourierOptimizer
+from courier_optimizer import _nn
+from courier_optimizer.types import Delivery, DeliveryBatch
 
 
 class TestCourierOptimizer:
@@ -54,6 +59,27 @@ class TestCourierOptimizer:
         assert any('coordinate' in warning.lower() or 'oslo' in warning.lower() 
                   for warning in result['warnings'])
 
+    def test_validation_flags_and_lazy_warnings(self):
+        """Violation bitmask should drive the (lazily built) warning list."""
+        from courier_optimizer.courier_optimizer import (
+            WEIGHT_OVER_MAX, PRIORITY_INVALID, CUSTOMER_EMPTY
+        )
+        optimizer = CourierOptimizer()
+        
+        result = optimizer.validate_delivery({
+            'customer': '  ',
+            'latitude': 59.91,
+            'longitude': 10.75,
+            'priority': 'urgent',
+            'weight_kg': 26.0
+        })
+        
+        assert result['_flags'] == WEIGHT_OVER_MAX | PRIORITY_INVALID | CUSTOMER_EMPTY
+        assert len(result['warnings']) == 3
+        assert result['warnings'][0] == "Weight 26.0kg exceeds maximum 25.0kg"
+        assert result['warnings'][-1] == "Customer name cannot be empty"
+        assert list(result['warnings']) == result['warnings']
+
     def test_csv_input_processing(self):
         """Test CSV file input processing."""
         optimizer = CourierOptimizer()
@@ -75,6 +101,50 @@ class TestCourierOptimizer:
         assert len(result['invalid_deliveries']) == 1
         assert result['invalid_deliveries'][0]['customer'] == 'C'
 
+    def test_csv_input_processing_arrow(self):
+        """A pyarrow.Table should validate exactly like the equivalent DataFrame."""
+        pa = pytest.importorskip('pyarrow')
+        optimizer = CourierOptimizer()
+        
+        sample_data = pd.DataFrame([
+            {'customer': 'A', 'latitude': 59.9139, 'longitude': 10.7522, 
+             'priority': 'HIGH', 'weight_kg': 15},
+            {'customer': 'B', 'latitude': 59.9200, 'longitude': 10.7500, 
+             'priority': 'low', 'weight_kg': 5},
+            {'customer': 'C', 'latitude': 60.5, 'longitude': 11.0, 
+             'priority': 'INVALID', 'weight_kg': 30},
+            {'customer': '  ', 'latitude': 59.9, 'longitude': 10.7, 
+             'priority': 'MEDIUM', 'weight_kg': -1}
+        ])
+        
+        expected = optimizer.process_csv_data(sample_data)
+        result = optimizer.process_csv_data(pa.Table.from_pandas(sample_data))
+        
+        assert len(result['valid_deliveries']) == 2
+        assert len(result['invalid_deliveries']) == 2
+        assert result['invalid_deliveries'][0]['customer'] == 'C'
+        assert result['valid_deliveries'].as_records() == expected['valid_deliveries'].as_records()
+        assert ([list(d['warnings']) for d in result['invalid_deliveries']] ==
+                [list(d['warnings']) for d in expected['invalid_deliveries']])
+
+    def test_non_string_customer_rejected_by_all_paths(self):
+        """A non-string customer should fail validation in the scalar and column paths."""
+        pa = pytest.importorskip('pyarrow')
+        optimizer = CourierOptimizer()
+        
+        record = {'customer': 123, 'latitude': 59.9139, 'longitude': 10.7522,
+                  'priority': 'HIGH', 'weight_kg': 5}
+        assert optimizer.validate_delivery(record)['is_valid'] is False
+        
+        mixed = pd.DataFrame([dict(record, customer='A'), record])
+        result = optimizer.process_csv_data(mixed)
+        assert len(result['valid_deliveries']) == 1
+        assert len(result['invalid_deliveries']) == 1
+        
+        result = optimizer.process_csv_data(pa.Table.from_pandas(pd.DataFrame([record])))
+        assert len(result['valid_deliveries']) == 0
+        assert len(result['invalid_deliveries']) == 1
+
     def test_transport_mode_selection(self):
         """Test transport mode options."""
         optimizer = CourierOptimizer()
@@ -108,6 +178,39 @@ class TestCourierOptimizer:
         distance_same = optimizer.calculate_distance(59.9, 10.75, 59.9, 10.75)
         assert distance_same == 0.0
 
+    @pytest.mark.parametrize("lat1, lon1, lat2, lon2", [
+        (59.9114, 10.7343, 59.9075, 10.7531),  # City Hall -> Opera House
+        (59.9, 10.75, 59.9, 10.75),            # Same point
+        (59.8, 10.6, 60.0, 10.9),              # Across the service area
+        (59.9139, 10.7522, 61.0, 12.0),        # Outside Oslo
+    ])
+    def test_vector_distance_matches_scalar(self, lat1, lon1, lat2, lon2):
+        """Vectorized distance should match the scalar calculation."""
+        optimizer = CourierOptimizer()
+        
+        scalar = optimizer.calculate_distance(lat1, lon1, lat2, lon2)
+        vector = optimizer.calculate_distances_vector([lat1], [lon1], [lat2], [lon2])
+        
+        assert vector.shape == (1,)
+        assert abs(vector[0] - scalar) < 1e-9
+
+    def test_oslo_fast_path_close_to_haversine(self):
+        """Equirectangular distances inside Oslo should stay within 0.05% of Haversine."""
+        optimizer = CourierOptimizer()
+        rng = np.random.default_rng(3)
+        lats1, lats2 = rng.uniform(59.71, 60.09, (2, 500))
+        lons1, lons2 = rng.uniform(10.51, 10.99, (2, 500))
+        
+        dlat = np.radians(lats2 - lats1)
+        dlon = np.radians(lons2 - lons1)
+        a = (np.sin(dlat / 2) ** 2
+             + np.cos(np.radians(lats1)) * np.cos(np.radians(lats2)) * np.sin(dlon / 2) ** 2)
+        haversine = 2 * optimizer.EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        
+        fast = optimizer.calculate_distances_vector(lats1, lons1, lats2, lons2)
+        
+        assert np.all(np.abs(fast - haversine) <= 5e-4 * haversine)
+
     def test_travel_time_calculation(self):
         """Test travel time calculation for different transport modes."""
         optimizer = CourierOptimizer()
@@ -200,4 +303,205 @@ class TestCourierOptimizer:
         
         route = optimizer.optimize_route(deliveries, 'CAR', 'FASTEST')
         assert len(route) == 1
-        assert route[0]['customer'] == 'Only One'
\ No newline at end of file
+        assert route[0]['customer'] == 'Only One'
+
+    def test_fast_io_reader_matches_default(self, tmp_path, monkeypatch):
+        """PyArrow CSV reader should produce the same DataFrame as pandas."""
+        pytest.importorskip('pyarrow')
+        optimizer = CourierOptimizer()
+        
+        csv_file = tmp_path / 'deliveries.csv'
+        csv_file.write_text(
+            "customer,latitude,longitude,priority,weight_kg\n"
+            "A,59.9139,10.7522,HIGH,15.5\n"
+            "B,59.9200,10.7500,LOW,5\n"
+        )
+        
+        monkeypatch.delenv('COURIER_FAST_IO', raising=False)
+        default_df = optimizer.read_deliveries_csv(str(csv_file))
+        
+        monkeypatch.setenv('COURIER_FAST_IO', '1')
+        fast_df = optimizer.read_deliveries_csv(str(csv_file))
+        
+        pd.testing.assert_frame_equal(fast_df, default_df)
+
+    def test_chunked_csv_writes_match_single_write(self, tmp_path):
+        """Writing output CSVs in small chunks should not change their content."""
+        optimizer = CourierOptimizer()
+        
+        route = [
+            {'customer': 'A', 'latitude': 59.91, 'longitude': 10.74,
+             'priority': 'HIGH', 'weight_kg': 5.0},
+            {'customer': 'B', 'latitude': 59.92, 'longitude': 10.75,
+             'priority': 'MEDIUM', 'weight_kg': 3.0},
+            {'customer': 'C', 'latitude': 59.90, 'longitude': 10.73,
+             'priority': 'LOW', 'weight_kg': 7.0},
+        ]
+        rejected = [dict(d, warnings=['Problem one', 'Problem two']) for d in route]
+        metrics = optimizer.calculate_route_metrics(route, 'CAR')
+        
+        optimizer.write_route_csv(route, metrics, str(tmp_path / 'route_full.csv'), 'CAR')
+        optimizer.write_route_csv(route, metrics, str(tmp_path / 'route_chunked.csv'), 'CAR',
+                                  chunk_size=2)
+        optimizer.write_rejected_csv(rejected, str(tmp_path / 'rejected_full.csv'))
+        optimizer.write_rejected_csv(rejected, str(tmp_path / 'rejected_chunked.csv'),
+                                     chunk_size=1)
+        
+        for name in ('route', 'rejected'):
+            full = pd.read_csv(tmp_path / f'{name}_full.csv')
+            chunked = pd.read_csv(tmp_path / f'{name}_chunked.csv')
+            assert len(chunked) == 3
+            pd.testing.assert_frame_equal(chunked, full)
+
+    def test_compiled_distance_matrix_matches_numpy(self, monkeypatch):
+        """The optional C kernel should build the same matrix as the NumPy path."""
+        pytest.importorskip('courier_optimizer._courier_c')
+        from courier_optimizer import courier_optimizer as module
+        optimizer = CourierOptimizer()
+        rng = np.random.default_rng(5)
+        coords = np.radians(np.column_stack((rng.uniform(59.8, 60.0, 300),
+                                             rng.uniform(10.6, 10.9, 300))))
+        
+        compiled = optimizer._build_distance_matrix(coords)
+        monkeypatch.setattr(module, '_courier_c', None)
+        reference = optimizer._build_distance_matrix(coords)
+        
+        assert compiled.dtype == np.float32
+        # The NumPy path computes in float32; allow 1 cm of difference
+        np.testing.assert_allclose(compiled, reference, rtol=1e-6, atol=1e-5)
+
+    def test_float32_distance_matrix_matches_scalar(self, monkeypatch):
+        """The float32 matrix should match float64 Haversine to float32 precision."""
+        from courier_optimizer import courier_optimizer as module
+        monkeypatch.setattr(module, '_courier_c', None)
+        optimizer = CourierOptimizer()
+        rng = np.random.default_rng(9)
+        lats = rng.uniform(59.0, 61.0, 60)
+        lons = rng.uniform(10.0, 12.0, 60)
+        
+        matrix = optimizer._build_distance_matrix(np.radians(np.column_stack((lats, lons))))
+        
+        assert matrix.dtype == np.float32
+        assert np.all(np.diag(matrix) == 0)
+        for i, j in [(0, 1), (5, 40), (59, 3), (17, 18)]:
+            # Compare against plain Haversine (outside the Oslo fast-path box)
+            phi1, phi2 = np.radians(lats[i]), np.radians(lats[j])
+            a = (np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2)
+                 * np.sin(np.radians(lons[j] - lons[i]) / 2) ** 2)
+            expected = 2 * optimizer.EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+            assert np.isclose(matrix[i, j], expected, rtol=1e-6, atol=1e-5)
+
+    @pytest.mark.parametrize("n", [0, 1, 2, 50])
+    def test_nn_tour_kernels_agree(self, n):
+        """Compiled (or fallback) tour kernel should match the NumPy reference."""
+        rng = np.random.default_rng(42)
+        dist = rng.random((n + 1, n + 1)).astype(np.float32)
+        dist = (dist + dist.T) / 2
+        codes = rng.integers(0, 3, n).astype(np.int8)
+        
+        tour = _nn.nn_tour(dist, codes)
+        
+        assert sorted(tour.tolist()) == list(range(n))
+        assert tour.tolist() == _nn._nn_tour_numpy(dist, codes).tolist()
+        # Priority groups are served in ascending code order
+        assert codes[tour].tolist() == sorted(codes.tolist())
+
+    def test_short_route_legs_match_vectorized(self, monkeypatch):
+        """Scalar legs for short routes should match the vectorized computation."""
+        from courier_optimizer import courier_optimizer as module
+        optimizer = CourierOptimizer()
+        rng = np.random.default_rng(11)
+        route = [{'latitude': lat, 'longitude': lon}
+                 for lat, lon in zip(rng.uniform(59.8, 60.0, 10), rng.uniform(10.6, 10.9, 10))]
+        
+        scalar = optimizer._route_leg_distances(route)
+        monkeypatch.setattr(module, '_VECTORIZE_THRESHOLD', 0)
+        vector = optimizer._route_leg_distances(route)
+        
+        assert scalar.shape == vector.shape == (11,)
+        np.testing.assert_allclose(scalar, vector, rtol=1e-12)
+
+    def test_delivery_record_access(self):
+        """Delivery records should support attribute and dict-style access."""
+        optimizer = CourierOptimizer()
+        delivery = Delivery('Customer A', 59.9139, 10.7522, 'HIGH', 15.5)
+        
+        assert not hasattr(delivery, '__dict__')
+        assert delivery.customer == delivery['customer'] == 'Customer A'
+        assert delivery.get('priority', 'LOW') == 'HIGH'
+        assert delivery.get('missing', 'default') == 'default'
+        with pytest.raises(KeyError):
+            delivery['missing']
+        assert dict(delivery) == delivery.as_dict()
+        assert optimizer.validate_delivery(delivery)['is_valid'] is True
+        
+        batch = optimizer.process_csv_data(pd.DataFrame([delivery.as_dict()]))['valid_deliveries']
+        assert batch[0] == delivery
+        assert isinstance(next(iter(batch)), Delivery)
+
+    def test_delivery_batch_keeps_extra_columns_and_slices(self):
+        """Extra CSV columns should survive validation, and batches should slice like lists."""
+        optimizer = CourierOptimizer()
+        data = pd.DataFrame([
+            {'customer': 'A', 'latitude': 59.91, 'longitude': 10.75,
+             'priority': 'HIGH', 'weight_kg': 5, 'note': 'ring twice'},
+            {'customer': 'B', 'latitude': 59.92, 'longitude': 10.76,
+             'priority': 'LOW', 'weight_kg': 3, 'note': ''},
+            {'customer': 'C', 'latitude': 59.93, 'longitude': 10.77,
+             'priority': 'MEDIUM', 'weight_kg': 2, 'note': 'back door'},
+        ])
+        
+        valid = optimizer.process_csv_data(data)['valid_deliveries']
+        assert valid[0]['note'] == 'ring twice'
+        assert [d['note'] for d in valid] == ['ring twice', '', 'back door']
+        
+        head = valid[:2]
+        assert isinstance(head, DeliveryBatch)
+        assert [d['customer'] for d in head] == ['A', 'B']
+        assert [d['customer'] for d in valid[::-1]] == ['C', 'B', 'A']
+
+    def test_delivery_batch_route_matches_list_route(self):
+        """Column batches from process_csv_data should route like the list of dicts."""
+        optimizer = CourierOptimizer()
+        rng = np.random.default_rng(7)
+        data = pd.DataFrame({
+            'customer': [f'C{i}' for i in range(40)],
+            'latitude': rng.uniform(59.85, 59.95, 40),
+            'longitude': rng.uniform(10.65, 10.85, 40),
+            'priority': rng.choice(['HIGH', 'MEDIUM', 'LOW'], 40),
+            'weight_kg': rng.uniform(1, 20, 40),
+        })
+        
+        batch = optimizer.process_csv_data(data)['valid_deliveries']
+        records = batch.as_records()
+        
+        assert isinstance(batch, DeliveryBatch)
+        assert len(batch) == 40
+        assert batch[0] == records[0] and batch[-1] == records[-1]
+        
+        batch_route = optimizer.optimize_route(batch, 'CAR', 'FASTEST')
+        list_route = optimizer.optimize_route(records, 'CAR', 'FASTEST')
+        
+        assert isinstance(batch_route, DeliveryBatch)
+        assert batch_route.as_records() == list_route
+        assert (optimizer.calculate_route_metrics(batch_route, 'CAR') ==
+                optimizer.calculate_route_metrics(list_route, 'CAR'))
+
+    def test_writers_create_output_directory_once(self, tmp_path, monkeypatch):
+        """Writers should create missing parent directories, only once per directory."""
+        optimizer = CourierOptimizer()
+        route = [{'customer': 'A', 'latitude': 59.91, 'longitude': 10.75,
+                  'priority': 'HIGH', 'weight_kg': 5.0}]
+        metrics = optimizer.calculate_route_metrics(route, 'CAR')
+        output_dir = tmp_path / 'nested' / 'output'
+        
+        optimizer.write_route_csv(route, metrics, output_dir / 'route.csv', 'CAR')
+        assert (output_dir / 'route.csv').exists()
+        
+        # The directory is cached now, so a second write must not call mkdir again
+        def fail_mkdir(self, *args, **kwargs):
+            raise AssertionError(f"unexpected mkdir({self})")
+        monkeypatch.setattr(Path, 'mkdir', fail_mkdir)
+        
+        optimizer.write_rejected_csv([], str(output_dir / 'rejected.csv'))
+        assert (output_dir / 'rejected.csv').exists()
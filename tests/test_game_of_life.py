@@ -2,9 +2,30 @@
 Tests for Conway's Game of Life - Grid Module
 """
 
+import pickle
+
+import numpy as np
 import pytest
+from game_of_life import _kernels, hashlife, leaf_table
 from game_of_life.grid import Grid
 from game_of_life.game_engine import GameOfLife
+from game_of_life.patterns import PatternLibrary
+from game_of_life.visualizer import Visualizer
+
+
+@pytest.fixture
+def visualizer():
+    """ASCII visualizer instance."""
+    return Visualizer()
+
+
+@pytest.fixture
+def blinker_game():
+    """5x5 game with a horizontal Blinker in the middle row."""
+    game = GameOfLife(5, 5)
+    for x in (1, 2, 3):
+        game.grid.set_cell(x, 2, True)
+    return game
 
 
 class TestGridInitialization:
@@ -56,6 +77,20 @@ class TestCellOperations:
             grid.get_cell(5, 5)  # Valid range is 0-4
         with pytest.raises(IndexError):
             grid.get_cell(-1, 0)
+    
+    def test_set_cells_bulk(self):
+        """Should set many cells at once and reject out of bounds coordinates."""
+        grid = Grid(5, 5)
+        grid.set_cells([(0, 0), (4, 2), (1, 3)])
+        assert grid.get_living_cells() == 3
+        assert grid.get_cell(4, 2) == True
+        
+        grid.set_cells([(4, 2)], False)
+        assert grid.get_cell(4, 2) == False
+        
+        with pytest.raises(IndexError):
+            grid.set_cells([(2, 2), (5, 0)])
+        assert grid.get_cell(2, 2) == False  # Nothing set on error
 
 
 class TestNeighborCounting:
@@ -76,11 +111,8 @@ class TestNeighborCounting:
         """Cell surrounded by all alive cells should count 8."""
         grid = Grid(5, 5)
         # Set all 8 neighbors alive around cell (2,2)
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue  # Skip the center cell
-                grid.set_cell(2 + dx, 2 + dy, True)
+        for dx, dy in _kernels.NEIGHBOR_OFFSETS:
+            grid.set_cell(2 + dx, 2 + dy, True)
         
         assert grid.count_neighbors(2, 2) == 8
     
@@ -92,6 +124,14 @@ class TestNeighborCounting:
         
         # Top-left corner should see it as a neighbor due to wrapping
         assert grid.count_neighbors(0, 0) == 1
+    
+    def test_count_neighbors_wraps_coordinates(self):
+        """Out of range coordinates should wrap around like the neighbors do."""
+        grid = Grid(5, 5)
+        grid.set_cell(1, 1, True)
+        assert grid.count_neighbors(5, 0) == grid.count_neighbors(0, 0) == 1
+        assert grid.count_neighbors(-3, 7) == grid.count_neighbors(2, 2) == 1
+        assert grid.count_neighbors(1, 1) == 0
 
 
 class TestGameOfLifeEngine:
@@ -105,51 +145,16 @@ class TestGameOfLifeEngine:
         assert game.width == 10
         assert game.height == 10
     
-    def test_conway_rule_survival(self):
-        """Living cell with 2-3 neighbors should survive."""
-        game = GameOfLife(5, 5)
-        
-        # Test with 2 neighbors (should survive)
-        assert game._apply_conway_rules(is_alive=True, neighbor_count=2) == True
-        
-        # Test with 3 neighbors (should survive)  
-        assert game._apply_conway_rules(is_alive=True, neighbor_count=3) == True
-    
-    def test_conway_rule_death_loneliness(self):
-        """Living cell with <2 neighbors should die."""
-        game = GameOfLife(5, 5)
-        
-        # Test with 0 neighbors (should die)
-        assert game._apply_conway_rules(is_alive=True, neighbor_count=0) == False
-        
-        # Test with 1 neighbor (should die)
-        assert game._apply_conway_rules(is_alive=True, neighbor_count=1) == False
-    
-    def test_conway_rule_death_overcrowding(self):
-        """Living cell with >3 neighbors should die."""
-        game = GameOfLife(5, 5)
-        
-        # Test with 4 neighbors (should die)
-        assert game._apply_conway_rules(is_alive=True, neighbor_count=4) == False
-        
-        # Test with 5 neighbors (should die)
-        assert game._apply_conway_rules(is_alive=True, neighbor_count=5) == False
-        
-        # Test with 8 neighbors (should die)
-        assert game._apply_conway_rules(is_alive=True, neighbor_count=8) == False
-    
-    def test_conway_rule_birth(self):
-        """Dead cell with exactly 3 neighbors should become alive."""
-        game = GameOfLife(5, 5)
-        
-        # Test with 3 neighbors (should be born)
-        assert game._apply_conway_rules(is_alive=False, neighbor_count=3) == True
-        
-        # Test with other neighbor counts (should stay dead)
-        assert game._apply_conway_rules(is_alive=False, neighbor_count=0) == False
-        assert game._apply_conway_rules(is_alive=False, neighbor_count=1) == False
-        assert game._apply_conway_rules(is_alive=False, neighbor_count=2) == False
-        assert game._apply_conway_rules(is_alive=False, neighbor_count=4) == False
+    @pytest.mark.parametrize("alive, count, expected", [
+        (True, 2, True), (True, 3, True),                     # Survival
+        (True, 0, False), (True, 1, False),                   # Death by loneliness
+        (True, 4, False), (True, 5, False), (True, 8, False),  # Death by overcrowding
+        (False, 3, True),                                     # Birth
+        (False, 0, False), (False, 1, False), (False, 2, False), (False, 4, False),  # Stay dead
+    ])
+    def test_conway_rule(self, alive, count, expected):
+        """Conway's rules for a cell given its state and neighbor count."""
+        assert GameOfLife._apply_conway_rules(is_alive=alive, neighbor_count=count) == expected
 
 
 class TestNextGenerationIntegration:
@@ -239,20 +244,230 @@ class TestNextGenerationIntegration:
         assert game.grid.get_cell(2, 3) == False  # Below
 
 
+class TestStepKernels:
+    """Test that the generation step kernels agree with the per-cell rules."""
+    
+    @pytest.mark.parametrize("width, height, alive", [
+        (1, 1, None), (2, 3, None), (5, 5, None), (17, 9, None), (64, 40, None),
+        # Fixed patterns with equal neighboring rows (random grids miss these)
+        (10, 10, [(5, 1), (4, 2), (4, 3)]),
+        (5, 1, [(1, 0), (2, 0), (3, 0)]),
+        (2, 2, [(1, 0), (1, 1)]),
+    ])
+    def test_step_kernels_match_conway_rules(self, width, height, alive):
+        """Every step kernel should match count_neighbors + rules."""
+        game = GameOfLife(width, height)
+        if alive is None:
+            rng = np.random.default_rng(width * 100 + height)
+            game.grid._cells[:] = rng.random((height, width)) < 0.35
+        else:
+            game.grid.set_cells(alive)
+        
+        expected = np.zeros((height, width), dtype=np.uint8)
+        for y in range(height):
+            for x in range(width):
+                expected[y, x] = game._apply_conway_rules(
+                    game.grid.get_cell(x, y), game.grid.count_neighbors(x, y))
+        
+        for kernel in _kernels.KERNELS.values():
+            out = np.empty_like(expected)
+            kernel(game.grid._cells, out)
+            assert np.array_equal(out, expected)
+    
+    def test_bits_backend_glider(self):
+        """The bit-parallel backend should evolve a glider like the default one."""
+        games = [GameOfLife(70, 9), GameOfLife(70, 9, backend='bits')]
+        for game in games:
+            game.grid.set_pattern([[0, 1, 0], [0, 0, 1], [1, 1, 1]], 66, 5)
+            for _ in range(12):
+                game.next_generation()
+        assert games[0].grid == games[1].grid
+        assert games[1].get_living_cells() == 5
+    
+    def test_tiled_kernel_multiple_strips(self):
+        """Strips smaller than the grid (including a short last strip) should match NumPy."""
+        rng = np.random.default_rng(7)
+        cells = (rng.random((23, 11)) < 0.4).astype(np.uint8)
+        expected = np.empty_like(cells)
+        _kernels._step_numpy(cells, expected)
+        
+        out = np.empty_like(cells)
+        _kernels.TiledStep(tile_height=5)(cells, out)
+        assert np.array_equal(out, expected)
+    
+    def test_process_kernel_bands(self):
+        """Row bands stepped in worker processes should match NumPy."""
+        rng = np.random.default_rng(21)
+        cells = (rng.random((17, 9)) < 0.4).astype(np.uint8)
+        expected = np.empty_like(cells)
+        _kernels._step_numpy(cells, expected)
+        
+        kernel = _kernels.ProcessStep(workers=3)
+        try:
+            out = np.empty_like(cells)
+            kernel(cells, out)
+        finally:
+            kernel.close()
+        assert np.array_equal(out, expected)
+    
+    def test_process_backend_per_game(self):
+        """Games using the process backend should each own their kernel."""
+        games = [GameOfLife(9, 6, backend='processes'), GameOfLife(4, 7, backend='processes')]
+        try:
+            assert games[0]._step is not games[1]._step
+            for game in games:
+                game.grid.set_cells([(1, 2), (2, 2), (3, 2)])
+                expected = game.grid.copy()
+                game.advance(2)  # Blinker period
+                assert game.grid == expected
+        finally:
+            for game in games:
+                game.close()
+    
+    def test_grid_pickles(self):
+        """A grid should survive a pickle round trip (as sent to worker processes)."""
+        grid = Grid(6, 4)
+        grid.set_cells([(0, 0), (5, 3)])
+        copy = pickle.loads(pickle.dumps(grid))
+        assert copy == grid
+        assert copy.get_living_cells() == 2
+    
+    def test_sparse_backend_blinker(self):
+        """The sparse backend should oscillate a blinker on a large, mostly empty grid."""
+        game = GameOfLife(200, 150, backend='sparse')
+        game.grid.set_pattern([[1, 1, 1]], 0, 149)  # wraps around the corner
+        
+        game.next_generation()
+        assert game.get_living_cells() == 3
+        assert game.grid.get_cell(1, 148) and game.grid.get_cell(1, 149) and game.grid.get_cell(1, 0)
+        
+        game.next_generation()
+        assert game.get_living_cells() == 3
+        assert game.grid.get_cell(0, 149) and game.grid.get_cell(2, 149)
+    
+    def test_next_generation_reuses_buffers(self):
+        """Generations should alternate between the same two cell arrays."""
+        game = GameOfLife(6, 6)
+        game.grid.randomize(0.5)
+        buffers = {id(game.grid._cells), id(game._back)}
+        
+        for _ in range(4):
+            game.next_generation()
+            assert {id(game.grid._cells), id(game._back)} == buffers
+    
+    def test_population_cache_tracks_changes(self):
+        """get_living_cells should stay correct as cells change and generations advance."""
+        game = GameOfLife(7, 7)
+        assert game.get_living_cells() == 0
+        
+        game.grid.set_pattern([[1, 1, 1]], 1, 2)
+        assert game.get_living_cells() == 3
+        game.grid.set_cell(5, 5, True)
+        assert game.get_living_cells() == 4
+        
+        # Repeated and no-op writes adjust the cached count correctly
+        game.grid.set_cell(5, 5, True)
+        game.grid.set_cell(0, 0, False)
+        game.grid.set_cell(2, 2, False)
+        assert game.grid._population == 3
+        game.grid.set_cell(2, 2, True)
+        assert game.get_living_cells() == 4
+        
+        game.next_generation()  # Blinker flips, lone cell dies
+        assert game.get_living_cells() == 3
+        
+        copy = game.grid.copy()
+        game.grid.clear()
+        assert game.get_living_cells() == 0
+        assert copy.get_living_cells() == 3
+    
+    def test_compiled_kernel_checks_shape(self):
+        """The Cython kernel (if built) should reject a mismatched output array."""
+        step_c = pytest.importorskip('game_of_life._step_c')
+        with pytest.raises(ValueError):
+            step_c.step_toroidal(np.zeros((4, 4), np.uint8), np.zeros((4, 5), np.uint8))
+    
+    def test_cupy_advance_matches_steps(self):
+        """The GPU advance (if CuPy is installed) should match stepping on the CPU."""
+        pytest.importorskip('cupy')
+        rng = np.random.default_rng(19)
+        cells = (rng.random((30, 40)) < 0.35).astype(np.uint8)
+        
+        stepped = GameOfLife(40, 30, backend='numpy')
+        jumped = GameOfLife(40, 30, backend='cupy')
+        stepped.grid._cells[:] = cells
+        jumped.grid._cells[:] = cells
+        
+        for _ in range(25):
+            stepped.next_generation()
+        jumped.advance(25)
+        
+        assert np.array_equal(jumped.grid._cells, stepped.grid._cells)
+        assert jumped.generation == 25
+    
+    @pytest.mark.parametrize("width, height, generations", [
+        (2, 2, 3), (8, 8, 1), (16, 16, 37), (32, 8, 100), (4, 16, 21),
+    ])
+    def test_hashlife_advance_matches_steps(self, width, height, generations):
+        """HashLife advance should match stepping one generation at a time."""
+        rng = np.random.default_rng(width * height + generations)
+        cells = (rng.random((height, width)) < 0.35).astype(np.uint8)
+        
+        stepped = GameOfLife(width, height)
+        jumped = GameOfLife(width, height, backend='hashlife')
+        stepped.grid._cells[:] = cells
+        jumped.grid._cells[:] = cells
+        
+        for _ in range(generations):
+            stepped.next_generation()
+        jumped.advance(generations)
+        
+        assert jumped.grid == stepped.grid
+        assert jumped.get_generation() == generations
+        assert jumped.get_living_cells() == stepped.get_living_cells()
+    
+    def test_neighborhood_table_matches_rules(self):
+        """The 512-entry 3x3 neighborhood table should agree with _apply_conway_rules."""
+        for code in range(512):
+            alive = bool(code & 0b000010000)
+            count = bin(code).count('1') - alive
+            assert leaf_table.NEXT_STATE[code] == GameOfLife._apply_conway_rules(alive, count)
+    
+    def test_leaf_table_matches_neighborhood_table(self):
+        """Each 4x4 block's packed centre should match four NEXT_STATE lookups."""
+        for block in range(0, 1 << 16, 7):
+            expected = 0
+            for bit, (row, col) in enumerate(leaf_table.LEAF_CENTRE):
+                expected |= leaf_table.NEXT_STATE[leaf_table.neighborhood(block, row, col)] << bit
+            assert leaf_table.LEAF_TABLE[block] == expected
+    
+    def test_hashlife_far_future_glider(self):
+        """A glider on a 64x64 torus repeats every 256 generations, even a billion ahead."""
+        far = GameOfLife(64, 64, backend='hashlife')
+        near = GameOfLife(64, 64)
+        for game in (far, near):
+            PatternLibrary.create_glider(game, 1, 1)
+        
+        far.advance(10 ** 9)
+        near.advance(10 ** 9 % 256)
+        assert far.grid == near.grid
+    
+    def test_unknown_backend(self):
+        """Should raise ValueError for an unknown backend."""
+        with pytest.raises(ValueError):
+            GameOfLife(5, 5, backend='gpu')
+
+
 class TestVisualizer:
     """Test the ASCII visualization system for Conway's Game of Life."""
     
-    def test_visualizer_imports(self):
+    def test_visualizer_imports(self, visualizer):
         """Visualizer class should be importable."""
-        from game_of_life.visualizer import Visualizer
-        visualizer = Visualizer()
         assert visualizer is not None
     
-    def test_display_empty_grid(self):
+    def test_display_empty_grid(self, visualizer):
         """Should display empty 3x3 grid with dead cell symbols."""
-        from game_of_life.visualizer import Visualizer
         grid = Grid(3, 3)
-        visualizer = Visualizer()
         
         output = visualizer.display_grid(grid, generation=0)
         
@@ -263,12 +478,10 @@ class TestVisualizer:
         # Should show generation counter
         assert "Generation: 0" in output
     
-    def test_display_grid_with_alive_cells(self):
+    def test_display_grid_with_alive_cells(self, visualizer):
         """Should display grid with both alive and dead cells."""
-        from game_of_life.visualizer import Visualizer
         grid = Grid(3, 3)
         grid.set_cell(1, 1, True)  # Center cell alive
-        visualizer = Visualizer()
         
         output = visualizer.display_grid(grid, generation=5)
         
@@ -278,13 +491,11 @@ class TestVisualizer:
         # Should show generation
         assert "Generation: 5" in output
     
-    def test_display_statistics(self):
+    def test_display_statistics(self, visualizer):
         """Should display population statistics."""
-        from game_of_life.visualizer import Visualizer
         grid = Grid(3, 3)
         grid.set_cell(0, 0, True)
         grid.set_cell(2, 2, True)
-        visualizer = Visualizer()
         
         output = visualizer.display_grid(grid, generation=1)
         
@@ -293,18 +504,17 @@ class TestVisualizer:
         # Should show total cells
         assert "9" in output  # 3x3 = 9 total cells
     
-    def test_blinker_pattern_visualization(self):
-        """Should properly display the famous Blinker pattern."""
-        from game_of_life.visualizer import Visualizer
-        grid = Grid(5, 5)
+    def test_compact_glyphs(self, blinker_game):
+        """Compact visualizer should draw cells with single-byte symbols."""
+        output = Visualizer.compact().display_grid(blinker_game.grid, generation=0)
         
-        # Set up Blinker pattern (horizontal)
-        grid.set_cell(1, 2, True)
-        grid.set_cell(2, 2, True) 
-        grid.set_cell(3, 2, True)
-        
-        visualizer = Visualizer()
-        output = visualizer.display_grid(grid, generation=0)
+        assert "●" not in output and "○" not in output
+        assert ". # # # ." in output.split('\n')
+        assert "Population: 3 / 25" in output
+    
+    def test_blinker_pattern_visualization(self, visualizer, blinker_game):
+        """Should properly display the famous Blinker pattern."""
+        output = visualizer.display_grid(blinker_game.grid, generation=0)
         
         # Should show horizontal line of alive cells
         lines = output.split('\n')
@@ -319,18 +529,9 @@ class TestVisualizer:
 class TestVisualizerGameIntegration:
     """Test visualizer integration with GameOfLife engine for animated simulation."""
     
-    def test_visualizer_with_game_evolution(self):
+    def test_visualizer_with_game_evolution(self, visualizer, blinker_game):
         """Should track visualization changes as game evolves."""
-        from game_of_life.visualizer import Visualizer
-        from game_of_life.game_engine import GameOfLife
-        
-        # Create game with Blinker pattern
-        game = GameOfLife(5, 5)
-        game.grid.set_cell(1, 2, True)
-        game.grid.set_cell(2, 2, True) 
-        game.grid.set_cell(3, 2, True)
-        
-        visualizer = Visualizer()
+        game = blinker_game
         
         # Generation 0 - horizontal
         gen0_display = visualizer.display_grid(game.grid, generation=0)
@@ -346,18 +547,9 @@ class TestVisualizerGameIntegration:
         # Displays should be different (pattern changed)
         assert gen0_display != gen1_display
     
-    def test_multi_generation_animation_sequence(self):
+    def test_multi_generation_animation_sequence(self, visualizer, blinker_game):
         """Should handle multiple generation evolution for animation."""
-        from game_of_life.visualizer import Visualizer
-        from game_of_life.game_engine import GameOfLife
-        
-        game = GameOfLife(5, 5)
-        visualizer = Visualizer()
-        
-        # Set up Blinker pattern
-        game.grid.set_cell(1, 2, True)
-        game.grid.set_cell(2, 2, True) 
-        game.grid.set_cell(3, 2, True)
+        game = blinker_game
         
         # Collect displays for multiple generations
         displays = []
@@ -384,13 +576,9 @@ class TestVisualizerGameIntegration:
         gen3_grid_lines = [line for line in displays[3].split('\n') if '●' in line or '○' in line]
         assert gen1_grid_lines == gen3_grid_lines  # Same pattern
     
-    def test_population_tracking_through_generations(self):
+    def test_population_tracking_through_generations(self, visualizer):
         """Should track population changes through generations."""
-        from game_of_life.visualizer import Visualizer
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(7, 7)
-        visualizer = Visualizer()
         
         # Start with single cell (will die)
         game.grid.set_cell(3, 3, True)
@@ -408,12 +596,8 @@ class TestVisualizerGameIntegration:
         assert "Population: 1" in gen0_display
         assert "Population: 0" in gen1_display
     
-    def test_clear_screen_functionality(self):
+    def test_clear_screen_functionality(self, visualizer):
         """Should provide screen clearing for animation."""
-        from game_of_life.visualizer import Visualizer
-        from game_of_life.grid import Grid
-        
-        visualizer = Visualizer()
         grid = Grid(3, 3)
         
         # Should not raise any exceptions
@@ -423,20 +607,17 @@ class TestVisualizerGameIntegration:
             visualizer.print_grid(grid, generation=0, clear=False)
         except Exception as e:
             pytest.fail(f"Screen clearing functionality failed: {e}")
-    
+
+
 class TestPatternLibrary:
     """Test the famous pattern library for Conway's Game of Life."""
     
     def test_pattern_library_imports(self):
         """Pattern library should be importable."""
-        from game_of_life.patterns import PatternLibrary
         assert PatternLibrary is not None
     
     def test_blinker_pattern_creation(self):
         """Should create Blinker oscillator pattern correctly."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(7, 7)
         PatternLibrary.create_blinker(game, 3, 3)
         
@@ -446,14 +627,11 @@ class TestPatternLibrary:
         assert game.grid.get_cell(4, 3) == True  # Right
         
         # Count total alive cells
-        alive_count = sum(1 for y in range(7) for x in range(7) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 3
     
     def test_block_pattern_creation(self):
         """Should create Block still life pattern correctly."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(5, 5)
         PatternLibrary.create_block(game, 1, 1)
         
@@ -464,14 +642,11 @@ class TestPatternLibrary:
         assert game.grid.get_cell(2, 2) == True  # Bottom-right
         
         # Count total alive cells
-        alive_count = sum(1 for y in range(5) for x in range(5) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 4
     
     def test_glider_pattern_creation(self):
         """Should create Glider spaceship pattern correctly."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(7, 7)
         PatternLibrary.create_glider(game, 1, 1)
         
@@ -482,14 +657,11 @@ class TestPatternLibrary:
             assert game.grid.get_cell(x, y) == True, f"Cell ({x},{y}) should be alive"
         
         # Count total alive cells
-        alive_count = sum(1 for y in range(7) for x in range(7) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 5
     
     def test_beehive_pattern_creation(self):
         """Should create Beehive still life pattern correctly."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(7, 7)
         PatternLibrary.create_beehive(game, 3, 3)
         
@@ -500,13 +672,11 @@ class TestPatternLibrary:
             assert game.grid.get_cell(x, y) == True, f"Cell ({x},{y}) should be alive"
         
         # Count total alive cells
-        alive_count = sum(1 for y in range(7) for x in range(7) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 6
     
     def test_pattern_info_retrieval(self):
         """Should provide information about available patterns."""
-        from game_of_life.patterns import PatternLibrary
-        
         info = PatternLibrary.get_pattern_info()
         
         # Should have all expected patterns
@@ -520,9 +690,6 @@ class TestPatternLibrary:
     
     def test_create_pattern_by_name(self):
         """Should create patterns by name using generic method."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(7, 7)
         
         # Test creating Blinker by name
@@ -530,42 +697,33 @@ class TestPatternLibrary:
         assert success == True
         
         # Verify pattern was created
-        alive_count = sum(1 for y in range(7) for x in range(7) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 3
     
     def test_create_pattern_with_default_position(self):
         """Should create patterns at center when no position specified."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(9, 9)  # 9x9 grid, center at (4,4)
         
         success = PatternLibrary.create_pattern("block", game)  # No x,y specified
         assert success == True
         
         # Should be created near center
-        alive_count = sum(1 for y in range(9) for x in range(9) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 4  # Block has 4 cells
     
     def test_invalid_pattern_name(self):
         """Should handle invalid pattern names gracefully."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(5, 5)
         
         success = PatternLibrary.create_pattern("invalid_pattern", game, 2, 2)
         assert success == False
         
         # Grid should remain empty
-        alive_count = sum(1 for y in range(5) for x in range(5) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 0
     
     def test_blinker_oscillation_with_library(self):
         """Should verify library Blinker oscillates correctly."""
-        from game_of_life.patterns import PatternLibrary
-        from game_of_life.game_engine import GameOfLife
-        
         game = GameOfLife(7, 7)
         PatternLibrary.create_blinker(game, 3, 3)
         
@@ -581,7 +739,7 @@ class TestPatternLibrary:
             assert game.grid.get_cell(x, y) == True
         
         # Population should remain 3
-        alive_count = sum(1 for y in range(7) for x in range(7) if game.grid.get_cell(x, y))
+        alive_count = game.grid.population()
         assert alive_count == 3
 
 